@@ -0,0 +1,70 @@
+import sys
+import os
+import glob
+import argparse
+import logging
+
+import diffuser.pipeline as pipeline
+
+from utils.cache import InputCache, ResultCache
+
+
+def parse_args(argv: list=None):
+
+    parser = argparse.ArgumentParser(
+        description='Headless pipe diffuser geometry generation from p1112 files'
+    )
+    parser.add_argument('indata', nargs='+',
+                        help='p1112 input files or directories containing *.p1112 files')
+    parser.add_argument('-n', '--num-sec', type=int, default=25, help='number of cross sections')
+    parser.add_argument('-o', '--outdir', default='outdata', help='output directory')
+    parser.add_argument('--charts', action='store_true', help='plot area and ECA charts')
+    parser.add_argument('--cache', default='', help='directory of the parsed input cache, off if not set')
+    parser.add_argument('--result-cache', default='',
+                        help='directory of the cross sections cache, off if not set')
+    parser.add_argument('--frame', choices=('euler', 'rmf'), default='euler',
+                        help='section orientation: legacy euler angles or rotation minimizing frames')
+    parser.add_argument('--mesh', type=int, nargs=2, metavar=('STATIONS', 'POINTS'),
+                        help='also write a STATIONS x POINTS surface grid as binary STL and PLOT3D')
+    parser.add_argument('--log', default='', help='log file, stderr if not set')
+
+    return parser.parse_args(argv)
+
+
+def collect_files(paths: list) -> list:
+
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, '*.p1112'))))
+        else:
+            files.append(path)
+    return files
+
+
+if __name__ == "__main__":
+
+    args = parse_args()
+
+    logging.basicConfig(filename=args.log or None, level=logging.INFO)
+    logger = logging.getLogger(__name__)
+
+    cache = InputCache(cache_dir=args.cache) if args.cache else None
+    result_cache = ResultCache(cache_dir=args.result_cache) if args.result_cache else None
+
+    failed = 0
+    for indata_file in collect_files(args.indata):
+        try:
+            pipeline.run(
+                indata_file=indata_file, num_sec=args.num_sec,
+                outdata_dir=args.outdir, charts=args.charts,
+                cache=cache, result_cache=result_cache, frame=args.frame, mesh=args.mesh
+            )
+        except (OSError, KeyError, ValueError, ArithmeticError) as ex:
+            failed += 1
+            logger.error('While processing {file} an error occurred {ex}'.format(file=indata_file, ex=ex))
+
+    if result_cache is not None:
+        logger.info('Cross sections cache: {hits} hits, {misses} misses'.format(**result_cache.stats))
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,74 @@
+import sys
+import argparse
+import logging
+
+import benchmark.runner as runner
+import benchmark.pipeline_cases as pipeline_cases
+
+from benchmark.mathlib_cases import cases as mathlib_cases
+from batch import collect_files
+
+
+def parse_args(argv: list=None):
+
+    parser = argparse.ArgumentParser(
+        description='Micro-benchmarks of the mathlib hot paths and end-to-end pipeline benchmarks'
+    )
+    parser.add_argument('suite', nargs='?', choices=('mathlib', 'pipeline'), default='mathlib',
+                        help='mathlib micro-benchmarks or the p1112 -> output files pipeline')
+    parser.add_argument('-o', '--output', default='', help='JSON file the results are written to')
+    parser.add_argument('--compare', default='',
+                        help='JSON results of an earlier run on the same machine to compare with')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='relative slowdown reported as a regression')
+    parser.add_argument('-k', '--filter', default='', help='run only the mathlib cases containing this text')
+    parser.add_argument('--repeat', type=int, default=None,
+                        help='timings per case, the best is kept (5 for mathlib, 3 for pipeline)')
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimum seconds per mathlib timing')
+    parser.add_argument('--indata', nargs='+', default=['indata'],
+                        help='pipeline p1112 input files or directories containing *.p1112 files')
+    parser.add_argument('-n', '--num-sec', type=int, nargs='+', default=list(pipeline_cases.SECTION_COUNTS),
+                        help='pipeline section counts')
+    parser.add_argument('--outdir', default='', help='pipeline output directory, temporary if not set')
+    parser.add_argument('--frame', choices=('euler', 'rmf'), default='euler', help='pipeline section frames')
+
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.suite == 'mathlib':
+        results = runner.run_cases(
+            cases=mathlib_cases(), repeat=args.repeat or 5, min_time=args.min_time, pattern=args.filter
+        )
+        print(runner.format_results(results))
+        key, higher_is_better = 'ops_per_sec', True
+    else:
+        results = pipeline_cases.run_benchmark(
+            files=collect_files(args.indata), section_counts=tuple(args.num_sec),
+            repeat=args.repeat or 3, outdata_dir=args.outdir, frame=args.frame
+        )
+        print(pipeline_cases.format_results(results))
+        key, higher_is_better = 'seconds', False
+
+    current = {'results': results}
+    if args.output:
+        current = runner.write_results(file=args.output, suite=args.suite, results=results)
+        logging.info(f'Results written to {args.output}')
+
+    regressions = 0
+    if args.compare:
+        baseline = runner.read_results(args.compare)
+        if baseline.get('suite', args.suite) != args.suite:
+            raise ValueError(f'{args.compare} holds {baseline["suite"]} results, not {args.suite}')
+        rows = runner.compare(
+            baseline=baseline, current=current, key=key,
+            threshold=args.threshold, higher_is_better=higher_is_better
+        )
+        print(runner.format_comparison(rows))
+        regressions = sum(1 for row in rows if row['regression'])
+
+    sys.exit(1 if regressions else 0)
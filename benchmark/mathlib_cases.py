@@ -0,0 +1,57 @@
+import math
+import random
+
+import mathlib.matrix as matrix
+
+from mathlib.bezier import BaseBezier, BezierThroughPoints
+from mathlib.quaternion import Quaternion
+from mathlib.dual_quaternion import DualQuaternion
+from mathlib.line_interpolation import LineInterpolation
+
+
+SPLINE_SIZES = (10, 100, 1000)
+
+
+def curve_points(num_points: int) -> list:
+    # Smooth x-monotone curve like the x-r / x-beta distributions
+    return [[i / (num_points - 1), 0.5 + 0.3 * math.sin(3 * i / (num_points - 1))] for i in range(num_points)]
+
+
+def cases(seed: int=0) -> dict:
+
+    # name -> callable without arguments; the inputs are built once here so only
+    # the call itself is timed
+    rnd = random.Random(seed)
+    out = {}
+
+    bezier = BaseBezier(points=[[0.0, 0.0], [0.3, 0.8], [0.7, 0.9], [1.0, 0.2]])
+    half = bezier.arc_length / 2
+    out['BaseBezier.get_coordinates[100]'] = lambda: bezier.get_coordinates(npoints=100)
+    out['BaseBezier.get_length'] = lambda: bezier.get_length()
+    out['BaseBezier.get_t'] = lambda: bezier.get_t(point=(0, 0.37))
+    out['BaseBezier.get_length_point'] = lambda: bezier.get_length_point(length=half)
+
+    # A new spline per call so the control points are solved every time
+    for size in SPLINE_SIZES:
+        points = curve_points(size)
+        out[f'BezierThroughPoints[{size}]'] = (
+            lambda points=points: BezierThroughPoints(points=points, npoints=2).state
+        )
+
+    m = [[rnd.uniform(-1.0, 1.0) + (10.0 if i == j else 0.0) for j in range(20)] for i in range(20)]
+    for backend in matrix.BACKENDS:
+        out[f'matrix.inverse[20x20,{backend}]'] = lambda backend=backend: matrix.inverse(m, backend=backend)
+
+    q1 = Quaternion(scalar=0.5, vector=[0.1, -0.7, 0.3])
+    q2 = Quaternion(scalar=-0.2, vector=[0.9, 0.4, -0.1])
+    out['Quaternion.mult'] = lambda: q1.mult(q2)
+
+    dq1 = DualQuaternion(D0=q1, D1=Quaternion(scalar=0.0, vector=[1.0, 2.0, 3.0]))
+    dq2 = DualQuaternion(D0=q2, D1=Quaternion(scalar=0.0, vector=[-1.0, 0.5, 0.0]))
+    out['DualQuaternion.mult'] = lambda: dq1.mult(dq2)
+
+    table = LineInterpolation(points=curve_points(100))
+    queries = sorted(rnd.uniform(0.0, 1.0) for _ in range(1000))
+    out['LineInterpolation.interpolate[100,1000]'] = lambda: table.interpolate(points=queries)
+
+    return out
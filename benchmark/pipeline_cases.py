@@ -0,0 +1,100 @@
+import os
+import time
+import shutil
+import tempfile
+import tracemalloc
+
+import diffuser.pipeline as pipeline
+
+
+SECTION_COUNTS = (20, 100, 500)
+STAGES = ('parse', 'mean_line', 'cross_sections', 'write')
+
+
+def stages(indata_file: str, num_sec: int, outdata_dir: str, frame: str='euler') -> list:
+
+    # The pipeline.run steps (without cache, mesh and charts) as (stage, callable)
+    # pairs sharing their intermediate results
+    name = os.path.splitext(os.path.split(indata_file)[1])[0]
+    prt_file = os.path.abspath(os.path.join(outdata_dir, f'{name}.prt'))
+    state = {}
+
+    def parse():
+        state['data'] = pipeline.parse_p1112(indata_file=indata_file)
+
+    def mean_line():
+        state['result'] = pipeline.compute_mean_line(data=state['data'], num_sec=num_sec, frame=frame)
+
+    def cross_sections():
+        state['result'] = pipeline.compute_cross_sections(data=state['data'], result=state['result'])
+
+    def write():
+        pipeline.write_outputs(result=state['result'], outdata_dir=outdata_dir, prt_file=prt_file)
+
+    return list(zip(STAGES, (parse, mean_line, cross_sections, write)))
+
+
+def profile(indata_file: str, num_sec: int, outdata_dir: str, repeat: int=3, frame: str='euler') -> dict:
+
+    # Per stage wall time (best of repeat untraced runs) and tracemalloc peak of
+    # the memory allocated within the stage; the total peak is traced over a
+    # whole run
+    seconds = {stage: float('inf') for stage in STAGES}
+    for _ in range(repeat):
+        for stage, func in stages(indata_file, num_sec, outdata_dir, frame):
+            start = time.perf_counter()
+            func()
+            seconds[stage] = min(seconds[stage], time.perf_counter() - start)
+
+    peaks = {}
+    for stage, func in stages(indata_file, num_sec, outdata_dir, frame):
+        tracemalloc.start()
+        try:
+            func()
+            peaks[stage] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    tracemalloc.start()
+    try:
+        for stage, func in stages(indata_file, num_sec, outdata_dir, frame):
+            func()
+        total_peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    out = {stage: {'seconds': seconds[stage], 'peak_bytes': peaks[stage]} for stage in STAGES}
+    out['total'] = {'seconds': sum(seconds.values()), 'peak_bytes': total_peak}
+    return out
+
+
+def run_benchmark(files: list, section_counts: tuple=SECTION_COUNTS, repeat: int=3,
+                  outdata_dir: str='', frame: str='euler') -> dict:
+
+    # Flat results keyed '<input>[<sections>].<stage>' like the micro-benchmarks.
+    # Outputs go to a temporary directory unless outdata_dir is given
+    tmp_dir = '' if outdata_dir else tempfile.mkdtemp(prefix='pipeline_bench_')
+    results = {}
+    try:
+        for indata_file in files:
+            name = os.path.splitext(os.path.split(indata_file)[1])[0]
+            for num_sec in section_counts:
+                stage_results = profile(
+                    indata_file=indata_file, num_sec=num_sec, repeat=repeat, frame=frame,
+                    outdata_dir=os.path.join(outdata_dir or tmp_dir, f'{name}_{num_sec}')
+                )
+                for stage, r in stage_results.items():
+                    results[f'{name}[{num_sec}].{stage}'] = r
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return results
+
+
+def format_results(results: dict) -> str:
+
+    lines = [f'{"case":<48}{"seconds":>12}{"peak MiB":>11}']
+    for name, r in results.items():
+        lines.append(f'{name:<48}{r["seconds"]:>12.4f}{r["peak_bytes"] / 2 ** 20:>11.2f}')
+    return '\n'.join(lines)
@@ -0,0 +1,155 @@
+import gc
+import json
+import time
+import platform
+import subprocess
+import tracemalloc
+
+import numpy as np
+
+
+def measure(func, repeat: int=5, min_time: float=0.2) -> dict:
+
+    # Best of repeat timings; each timing runs func enough times to last at
+    # least min_time. Allocations are traced on a separate call so tracing does
+    # not slow the timed loops
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 10**7:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    timings = [elapsed / loops]
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat - 1):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            timings.append((time.perf_counter() - start) / loops)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    best = min(timings)
+    return {
+        'seconds_per_op': best,
+        'ops_per_sec': 1 / best if best > 0 else float('inf'),
+        'loops': loops,
+        'repeat': repeat,
+        **allocations(func)
+    }
+
+
+def allocations(func) -> dict:
+
+    # Peak traced memory of one call and the number of memory blocks the call
+    # leaves allocated (its result included)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    exclude = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(exclude)
+        result = func()
+        after = tracemalloc.take_snapshot().filter_traces(exclude)
+    finally:
+        tracemalloc.stop()
+
+    del result
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    return {'peak_bytes': peak, 'blocks': blocks}
+
+
+def run_cases(cases: dict, repeat: int=5, min_time: float=0.2, pattern: str='') -> dict:
+
+    results = {}
+    for name, func in cases.items():
+        if pattern and pattern not in name:
+            continue
+        results[name] = measure(func=func, repeat=repeat, min_time=min_time)
+    return results
+
+
+def environment() -> dict:
+
+    # Results are only comparable on the same machine and interpreter
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ''
+
+    return {
+        'machine': platform.node(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+
+def write_results(file: str, suite: str, results: dict) -> dict:
+
+    report = {'suite': suite, 'environment': environment(), 'results': results}
+    with open(file, 'w') as fo:
+        json.dump(report, fo, indent=2)
+    return report
+
+
+def read_results(file: str) -> dict:
+    with open(file, 'r') as fi:
+        return json.load(fi)
+
+
+def compare(baseline: dict, current: dict, key: str='ops_per_sec', threshold: float=0.1,
+            higher_is_better: bool=True) -> list:
+
+    # Cases present in both runs with the change of key; a case regresses when
+    # it got worse by more than threshold (relative)
+    rows = []
+    for name in sorted(set(baseline['results']) & set(current['results'])):
+        old = baseline['results'][name][key]
+        new = current['results'][name][key]
+        ratio = new / old if old else float('inf')
+        change = ratio - 1 if higher_is_better else 1 - ratio
+        rows.append({
+            'name': name, 'baseline': old, 'current': new,
+            'ratio': ratio, 'regression': change < -threshold
+        })
+    return rows
+
+
+def format_results(results: dict) -> str:
+
+    lines = [f'{"case":<44}{"ops/sec":>14}{"us/op":>12}{"peak KiB":>11}{"blocks":>9}']
+    for name, r in results.items():
+        lines.append(
+            f'{name:<44}{r["ops_per_sec"]:>14.1f}{r["seconds_per_op"] * 10**6:>12.2f}'
+            f'{r["peak_bytes"] / 1024:>11.1f}{r["blocks"]:>9}'
+        )
+    return '\n'.join(lines)
+
+
+def format_comparison(rows: list) -> str:
+
+    lines = [f'{"case":<44}{"baseline":>14}{"current":>14}{"ratio":>8}']
+    for row in rows:
+        flag = '  REGRESSION' if row['regression'] else ''
+        lines.append(
+            f'{row["name"]:<44}{row["baseline"]:>14.4g}{row["current"]:>14.4g}{row["ratio"]:>8.2f}{flag}'
+        )
+    return '\n'.join(lines)
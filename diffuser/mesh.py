@@ -0,0 +1,128 @@
+import struct
+
+import numpy as np
+
+from mathlib.math import linspace
+from mathlib.line_interpolation import LineInterpolation
+
+
+# Points per arc in the outlines the grid nodes are resampled from, per grid point
+ARC_SAMPLES = 8
+
+
+def surface_grid(data: dict, result: dict, stations: int=200, points: int=64) -> np.ndarray:
+
+    # Pipe passage wall sampled on a structured grid: (stations, points, 3).
+    # Every station is a full section of the diffuser placed on the mean line
+    # with wh, area and twist interpolated at its length, so the grid follows
+    # the same geometry as the cross sections, only denser. The arcs of a
+    # section differ a lot in length (on round sections two of them only span
+    # the joins), so the nodes are spaced evenly along the outline instead
+    if points < 3:
+        raise ValueError(f'Number of circumferential points {points} must be at least 3')
+
+    pipe_diffuser = result['diffuser']
+    length = linspace(start=0.0, stop=result['length'][-1], num_points=stations)
+
+    wh = LineInterpolation(points=data['wh']).interpolate(points=length)
+    area = LineInterpolation(points=data['area']).interpolate(points=length)
+    twist = LineInterpolation(points=data['twist']).interpolate(points=length)
+    if not len(wh) == len(area) == len(twist) == stations:
+        raise ValueError('Distributions do not cover the mean line length')
+
+    sections = pipe_diffuser.sample_sections(
+        lengths=length, wh=[p[1] for p in wh], area=[p[1] for p in area],
+        twist=[p[1] for p in twist], arc_points=ARC_SAMPLES * points + 1
+    )
+
+    # Consecutive arcs share their end points, the closing point is dropped
+    outlines = sections[:, :, :-1, :].reshape(len(sections), -1, 3)
+    return resample_closed(outlines=outlines, points=points)
+
+
+def resample_closed(outlines: np.ndarray, points: int) -> np.ndarray:
+
+    # Closed (n, m, 3) polylines -> (n, points, 3) nodes evenly spaced by arc
+    # length, each outline starting at its first point
+    outlines = np.asarray(outlines, dtype=float)
+    closed = np.concatenate((outlines, outlines[:, :1]), axis=1)
+    segments = np.linalg.norm(np.diff(closed, axis=1), axis=2)
+    cumulative = np.concatenate((np.zeros((len(closed), 1)), np.cumsum(segments, axis=1)), axis=1)
+    perimeter = cumulative[:, -1:]
+    if np.any(perimeter <= 0):
+        raise ValueError('Outline of zero length can\'t be resampled')
+
+    # Outlines are searched at once with every row shifted by its index
+    rows = np.arange(len(closed))[:, None]
+    s = cumulative / perimeter + rows
+    targets = np.arange(points) / points + rows
+    idx = np.searchsorted(s.ravel(), targets.ravel(), side='right') - 1
+    idx = np.clip(idx - (rows * closed.shape[1]).repeat(points, axis=1).ravel(), 0, closed.shape[1] - 2)
+
+    row = rows.repeat(points, axis=1).ravel()
+    s0, s1 = s[row, idx], s[row, idx + 1]
+    ds = s1 - s0
+    w = np.divide(targets.ravel() - s0, ds, out=np.zeros(ds.shape), where=ds > 0)
+    nodes = closed[row, idx] + w[:, None] * (closed[row, idx + 1] - closed[row, idx])
+
+    return nodes.reshape(len(closed), points, 3)
+
+
+def grid_triangles(grid: np.ndarray) -> np.ndarray:
+
+    # Structured (stations, points, 3) grid closed around the circumference ->
+    # (2 * (stations - 1) * points, 3, 3) triangles, two per quad
+    grid = np.asarray(grid, dtype=float)
+    closed = np.concatenate((grid, grid[:, :1]), axis=1)
+    p00, p01 = closed[:-1, :-1], closed[:-1, 1:]
+    p10, p11 = closed[1:, :-1], closed[1:, 1:]
+    triangles = np.stack((
+        np.stack((p00, p10, p11), axis=-2),
+        np.stack((p00, p11, p01), axis=-2)
+    ), axis=2)
+    return triangles.reshape(-1, 3, 3)
+
+
+def write_stl(file: str, grid: np.ndarray, units: float=1.0, name: str='pipe_diffuser') -> str:
+
+    # Binary STL: 80 byte header, triangle count, then per triangle the unit
+    # normal, three vertices (float32) and a zero attribute word
+    triangles = grid_triangles(grid=np.asarray(grid, dtype=float) * units)
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    norms = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.divide(normals, norms, out=np.zeros(normals.shape), where=norms > 0)
+
+    records = np.zeros(len(triangles), dtype=np.dtype([
+        ('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')
+    ]))
+    records['normal'] = normals
+    records['vertices'] = triangles
+
+    with open(file, 'wb') as fo:
+        fo.write(name.encode('ascii', 'replace')[:80].ljust(80, b'\0'))
+        fo.write(struct.pack('<I', len(records)))
+        fo.write(records.tobytes())
+
+    return file
+
+
+def write_plot3d(file: str, grids: list, units: float=1.0) -> str:
+
+    # Multi-block 3D PLOT3D grid, binary without record markers: block count,
+    # (idim, jdim, kdim) per block, then x, y, z of every block (i fastest).
+    # i runs around the circumference with the seam point repeated, j along
+    # the stations and k = 1 for a surface
+    blocks = []
+    for grid in grids:
+        grid = np.asarray(grid, dtype=float) * units
+        blocks.append(np.concatenate((grid, grid[:, :1]), axis=1))
+
+    with open(file, 'wb') as fo:
+        fo.write(struct.pack('<i', len(blocks)))
+        for block in blocks:
+            fo.write(struct.pack('<3i', block.shape[1], block.shape[0], 1))
+        for block in blocks:
+            for axis in range(3):
+                fo.write(np.ascontiguousarray(block[..., axis], dtype='<f8').tobytes())
+
+    return file
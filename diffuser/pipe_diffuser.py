@@ -1,6 +1,8 @@
 import math
 
-from mathlib.dual_quaternion import DualQuaternion as DQ
+import numpy as np
+
+from mathlib.dual_quaternion import DualQuaternion as DQ, quaternion_product, transform_matrices
 from mathlib.quaternion import Quaternion as Q
 from mathlib.vector import scalar_vector
 
@@ -11,29 +13,58 @@ from mathlib.shape import Circle, Line
 
 
 class PipeDiffuser:
+
+    STAGES = ('xteta', 'mean_line', 'placements', 'shapes', 'sections')
+
+    # Section orientation along the mean line: 'euler' yaw/pitch angles of the
+    # tangent per section (legacy) or 'rmf' rotation minimizing frames of the
+    # mean line spline seeded with the euler frame of the first section
+    FRAMES = ('euler', 'rmf')
+
+    # Unit mean line tangents with |dx| below this lie in the radial plane for
+    # the euler angles; the spline leaves ~1e-5 of noise there, which must not
+    # decide the branch
+    RADIAL_TOLERANCE = 10**-3
+
     def __init__(self, *args, **kwargs):
         self.__num_pipes = kwargs.get('num_pipes', 21)
         self.__rimp = kwargs.get('r_tan_imp')
-        self.__xbeta = kwargs.get('xbeta', [])
-        self.__xr = kwargs.get('xr', [])
+        self.__xbeta = [list(p) for p in kwargs.get('xbeta', [])]
+        self.__xr = [list(p) for p in kwargs.get('xr', [])]
         self.__length_star = kwargs.get('length_star', 0.0)
         self.__del_length_star = kwargs.get('del_length_star', 0.0)
         self.__rimp = kwargs.get('rimp', 0.0)
-        self.__wh = kwargs.get('wh', [])
-        self.__area = kwargs.get('area', [])
+        self.__wh = [list(p) for p in kwargs.get('wh', [])]
+        self.__area = [list(p) for p in kwargs.get('area', [])]
         self.__xteta = self.__calc_xteta(xbeta=self.__xbeta, xr=self.__xr)
         self.__mean_line = []
-        self.__twist = kwargs.get('twist', [])
-        self.__lengths = kwargs.get('lengths', [])
+        self.__twist = [list(p) for p in kwargs.get('twist', [])]
+        self.__lengths = list(kwargs.get('lengths', []))
         self.__cross_sections = []
         self.__ml_bezier = None
         self.__rexit = kwargs.get('r_exit_case', 100)
         self.__radial_gap = kwargs.get('radial_gap', 0.2)
+        self.__result_cache = kwargs.get('result_cache', None)
+        self.__frame = kwargs.get('frame', 'euler')
+        self.__arc_points = kwargs.get('arc_points', 3)
+        if self.__frame not in self.FRAMES:
+            raise ValueError(f'Unknown frame {self.__frame}, one of {self.FRAMES} expected')
+
+        # Stages whose cached results are out of date. Setters mark the stages
+        # depending on the changed input: xteta -> mean_line -> placements,
+        # shapes (wh, area, exit case) and sections (final transforms, twist)
+        self.__dirty = set(self.STAGES)
+        self.__dirty.discard('xteta')
+        self.__placements = []
+        self.__shapes = np.zeros((0, 4, 3, 3))
+
 
+    # Distributions are copied in and out: edits to a list handed back by a
+    # getter are only seen (and invalidate stages) once it is set again
 
     @property
     def lengths(self):
-        return self.__lengths
+        return list(self.__lengths)
 
     @property
     def num_pipes(self):
@@ -45,11 +76,11 @@ class PipeDiffuser:
 
     @property
     def xbeta(self):
-        return self.__xbeta
+        return [list(p) for p in self.__xbeta]
 
     @property
     def xr(self):
-        return self.__xr
+        return [list(p) for p in self.__xr]
 
     @property
     def length_star(self):
@@ -61,23 +92,30 @@ class PipeDiffuser:
 
     @property
     def xteta(self):
+        if 'xteta' in self.__dirty:
+            self.__xteta = self.__calc_xteta(xbeta=self.__xbeta, xr=self.__xr)
+            self.__dirty.discard('xteta')
         return self.__xteta
 
+    @property
+    def dirty(self) -> set:
+        return set(self.__dirty)
+
     @property
     def mean_line(self):
         return self.__mean_line
 
     @property
     def area(self):
-        return self.__area
+        return [list(p) for p in self.__area]
 
     @property
     def wh(self):
-        return self.__wh
+        return [list(p) for p in self.__wh]
 
     @property
     def twist(self):
-        return self.__twist
+        return [list(p) for p in self.__twist]
 
     @property
     def cross_sections(self):
@@ -95,24 +133,66 @@ class PipeDiffuser:
     def radial_gap(self):
         return self.__radial_gap
 
+    @property
+    def result_cache(self):
+        return self.__result_cache
+
+    @property
+    def frame(self) -> str:
+        return self.__frame
+
+    @property
+    def arc_points(self) -> int:
+        return self.__arc_points
+
+    @arc_points.setter
+    def arc_points(self, value: int):
+        if isinstance(value, int) and value >= 2:
+            if value != self.__arc_points:
+                self.invalidate('shapes')
+            self.__arc_points = value
+
+    @frame.setter
+    def frame(self, frame: str):
+        if frame in self.FRAMES:
+            if frame != self.__frame:
+                self.invalidate('placements')
+            self.__frame = frame
+
+    @result_cache.setter
+    def result_cache(self, cache: object):
+        self.__result_cache = cache
+
     @lengths.setter
     def lengths(self, points: list):
         if hasattr(points, '__iter__') and check_points(points=points):
+            points = list(points)
+            if points != self.__lengths:
+                self.invalidate('placements')
             self.__lengths = points
 
     @area.setter
     def area(self, points: list):
         if hasattr(points, '__iter__') and check_points(points=points):
+            points = [list(p) for p in points]
+            if points != self.__area:
+                self.invalidate('shapes')
             self.__area = points
 
     @wh.setter
     def wh (self, points: list):
         if hasattr(points, '__iter__') and check_points(points=points):
+            points = [list(p) for p in points]
+            if points != self.__wh:
+                self.invalidate('shapes')
             self.__wh = points
 
     @twist.setter
     def twist(self, points: list):
         if hasattr(points, '__iter__') and check_points(points=points):
+            points = [list(p) for p in points]
+            if points != self.__twist:
+                self.invalidate('sections')
             self.__twist = points
 
     @num_pipes.setter
@@ -123,21 +203,38 @@ class PipeDiffuser:
     @rimp.setter
     def rimp(self, value: float):
         if isinstance(value, (int, float)):
+            if value != self.__rimp:
+                self.invalidate('xteta')
             self.__rimp = value
 
     @xbeta.setter
     def xbeta(self, points: list):
         if hasattr(points, '__iter__') and check_points(points=points):
+            points = [list(p) for p in points]
+            if points != self.__xbeta:
+                self.invalidate('xteta')
             self.__xbeta = points
+
+    @xr.setter
+    def xr(self, points: list):
+        if hasattr(points, '__iter__') and check_points(points=points):
+            points = [list(p) for p in points]
+            if points != self.__xr:
+                self.invalidate('xteta')
+            self.__xr = points
     
     @length_star.setter
     def length_star(self, value: float):
         if isinstance(value, (int, float)):
+            if value != self.__length_star:
+                self.invalidate('xteta')
             self.__length_star = value
 
     @del_length_star.setter
     def del_length_star(self, value: float):
         if isinstance(value, (int, float)):
+            if value != self.__del_length_star:
+                self.invalidate('xteta')
             self.__del_length_star = value
 
     @xteta.setter
@@ -149,13 +246,31 @@ class PipeDiffuser:
     @rexit.setter
     def rexit(self, value: float):
         if isinstance(value, (int, float)):
+            if value != self.__rexit:
+                self.invalidate('shapes')
             self.__rexit = value
 
     @radial_gap.setter
     def radial_gap(self, value: float):
         if isinstance(value, (int, float)):
+            if value != self.__radial_gap:
+                self.invalidate('shapes')
             self.__radial_gap = value
 
+    def invalidate(self, *stages):
+        # Marks the given stages (all if none given) and every later stage
+        # depending on them as out of date
+        stages = stages or self.STAGES
+        for stage in stages:
+            if stage not in self.STAGES:
+                raise ValueError(f'Unknown stage {stage}')
+        self.__dirty.update(stages)
+        if 'xteta' in stages:
+            self.__dirty.add('mean_line')
+        if 'mean_line' in self.__dirty:
+            self.__dirty.add('placements')
+        self.__dirty.add('sections')
+
     def __calc_xteta(self, xbeta: list, xr: list):
 
         teta0 = math.atan((self.length_star + self.del_length_star) / self.rimp)
@@ -175,9 +290,11 @@ class PipeDiffuser:
         
         self.__mean_line = [
             [xri[0], xri[1] * math.sin(tetai[1]), xri[1] * math.cos(tetai[1])]
-            for xri, tetai in zip(self.__xr, self.__xteta)
+            for xri, tetai in zip(self.__xr, self.xteta)
         ]
         self.__ml_bezier = bezier(points=self.__mean_line)
+        self.__dirty.discard('mean_line')
+        self.__dirty.update(('placements', 'sections'))
         return self.__mean_line
 
     def get_mean_line_length(self):
@@ -189,105 +306,198 @@ class PipeDiffuser:
             return 0.0
 
     def compute_cross_section(self, wh: float=1.0, area: float=1.0):
-
-        cross_section = []
-
-        if wh == 1:
+        return self.compute_section_shapes(wh=[wh], area=[area], num_points=3)[0].tolist()
+
+    def compute_section_shapes(self, wh: list, area: list, num_points: int=None) -> np.ndarray:
+
+        # Section outlines of all stations in the local plane z = 0:
+        # (n_stations, 4 arcs, num_points, 3). wh == 1 gives a circle split in
+        # four arcs around the local y axis, otherwise two end circles of
+        # diameter h joined by arcs concentric with the exit case
+        num_points = num_points or self.__arc_points
+        wh = np.asarray(wh, dtype=float)
+        area = np.asarray(area, dtype=float)
+        circle = wh == 1
+        gap = math.radians(1.5)
+
+        centers = np.zeros(wh.shape + (4, 2))
+        radii = np.zeros(wh.shape + (4,))
+        a1 = np.zeros(wh.shape + (4,))
+        a2 = np.zeros(wh.shape + (4,))
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # Circular sections
             radius = (area / math.pi) ** 0.5
-            c1 = Circle(center=[0.0, 0.0, 0.0], radius=radius)
-            c2 = Circle(center=[0.0, 0.0, 0.0], radius=radius)
-            cross_section.append([
-                point for point in c1.get_points(
-                    a1=3*math.pi/2 - math.radians(1.5), a2=math.pi/2 + math.radians(1.5),
-                    num_points=3)
-            ])
-            cross_section.append([
-                point for point in c1.get_points(
-                    a1=math.pi/2 + math.radians(1.5), a2=math.pi/2 - math.radians(1.5),
-                    num_points=3)
-            ])
-            cross_section.append([
-                point for point in c2.get_points(
-                    a1=math.pi/2 - math.radians(1.5), a2=-math.pi/2 + math.radians(1.5),
-                    num_points=3)
-            ])
-            cross_section.append([
-                point for point in c2.get_points(
-                    a1=-math.pi/2 + math.radians(1.5), a2=-math.pi/2 - math.radians(1.5),
-                    num_points=3)
-            ])
-        else:
-            h = (area / (wh - 1 + math.pi / 4)) ** 0.5
-            w = wh * h
-            c1 = Circle(center=[-w/2+h/2, 0.0, 0.0], radius=h/2)
-            c2 = Circle(center=[w/2-h/2, 0.0, 0.0], radius=h/2)
+            radii[circle] = radius[circle, None]
+            a1[circle] = [3*math.pi/2 - gap, math.pi/2 + gap, math.pi/2 - gap, -math.pi/2 + gap]
+            a2[circle] = [math.pi/2 + gap, math.pi/2 - gap, -math.pi/2 + gap, -math.pi/2 - gap]
+
+            # Oval sections
+            oval = ~circle
+            h = (area[oval] / (wh[oval] - 1 + math.pi / 4)) ** 0.5
+            w = wh[oval] * h
+            r1 = h / 2
+            x1 = -w/2 + h/2
             rup = self.rexit - self.radial_gap
-            x0 = 0.0
-            y0 = 0.0 - ((rup - c1.radius) ** 2 - c1.center_point[0] ** 2) ** 0.5
+            rdown = self.rexit - self.radial_gap - 2 * r1
+            teta = np.arcsin(np.abs(x1) / (rup - r1))
 
-            c3 = Circle(center=[x0, y0, 0.0], radius=rup)
-            teta = math.asin(abs(c1.center_point[0]) / (c3.radius - c1.radius))
+            centers[oval, 0, 0] = x1
+            centers[oval, 1, 1] = -((rup - r1) ** 2 - x1 ** 2) ** 0.5
+            centers[oval, 2, 0] = w/2 - h/2
+            centers[oval, 3, 1] = -((rdown + r1) ** 2 - x1 ** 2) ** 0.5
+            radii[oval] = np.stack((r1, np.full(r1.shape, rup), r1, rdown), axis=-1)
+            a1[oval] = np.stack((3*math.pi/2 + teta, math.pi/2 + teta, math.pi/2 - teta, math.pi/2 - teta), axis=-1)
+            a2[oval] = np.stack((math.pi/2 + teta, math.pi/2 - teta, -math.pi/2 - teta, math.pi/2 + teta), axis=-1)
 
-            rdown = self.rexit - self.radial_gap - 2 * c1.radius
-            x0 = 0.0
-            y0 = 0.0 - ((rdown + c1.radius) ** 2 - c1.center_point[0] ** 2) ** 0.5
-            c4 = Circle(center=[x0, y0, 0.0], radius=rdown)
+        steps = np.arange(num_points)
+        angles = a1[..., None] + steps * ((a2 - a1) / (num_points - 1))[..., None]
+        shapes = np.zeros(angles.shape + (3,))
+        shapes[..., 0] = centers[..., 0, None] + radii[..., None] * np.cos(angles)
+        shapes[..., 1] = centers[..., 1, None] + radii[..., None] * np.sin(angles)
 
-            cross_section.append([
-                point for point in c1.get_points(a1=(3*math.pi/2+teta), a2=(math.pi/2+teta), num_points=3)
-            ])
+        if not np.all(np.isfinite(shapes)):
+            stations = np.unique(np.nonzero(~np.isfinite(shapes))[0]).tolist()
+            raise ValueError(f'Cross sections {stations} do not fit the exit case')
 
-            cross_section.append([
-                point for point in c3.get_points(a1=(math.pi/2+teta), a2=(math.pi/2-teta), num_points=3)
-            ])
+        return shapes
 
-            cross_section.append([
-                point for point in c2.get_points(a1=(math.pi/2-teta), a2=(-math.pi/2-teta), num_points=3)
-            ])
-
-            cross_section.append([
-                point for point in c4.get_points(a1=(math.pi/2-teta), a2=(math.pi/2+teta), num_points=3)
-            ])
-
-        return cross_section
-            
     def compute_cross_sections(self, wh: list=[], area: list=[], lengths: list=[]):
 
         if not wh or hasattr(wh, '__iter__') or check_points(points=wh):
-            wh = self.wh
+            wh = self.__wh
         
         if not area or hasattr(area, '__iter__') or check_points(points=area):
-            area = self.area
+            area = self.__area
 
         if not area or hasattr(lengths, '__iter__') or check_points(points=lengths):
-            lengths = self.lengths
+            lengths = self.__lengths
+
+        # One wh, area and twist value per section length, nothing is truncated
+        self.__check_stations(lengths=lengths, wh=self.__wh, area=self.__area, twist=self.__twist)
+
+        # Only the stages depending on changed inputs are recomputed
+        if self.__ml_bezier is None or 'mean_line' in self.__dirty:
+            self.compute_mean_line()
+        if 'sections' not in self.__dirty:
+            return self.__cross_sections
+
+        # Opt-in disk cache: the sections depend only on the mean line, the
+        # distributions, the exit case geometry and the points per arc
+        key = None
+        if self.__result_cache is not None:
+            key = self.__result_cache.key(
+                mean_line=self.__mean_line, wh=self.__wh, area=self.__area, twist=self.__twist,
+                lengths=self.__lengths, rexit=self.rexit, radial_gap=self.radial_gap,
+                frame=self.FRAMES.index(self.__frame), arc_points=self.__arc_points
+            )
+            sections = self.__result_cache.load(key=key)
+            if sections is not None:
+                self.__cross_sections = [[points[-1], points] for points in sections]
+                self.__dirty.discard('sections')
+                return self.__cross_sections
+
+        if 'placements' in self.__dirty:
+            self.__placements = self.__compute_placements(lengths=lengths)
+            self.__dirty.discard('placements')
+
+        if 'shapes' in self.__dirty:
+            self.__shapes = self.compute_section_shapes(
+                wh=[round(whi[1], 5) for whi in self.__wh],
+                area=[round(areai[1], 5) for areai in self.__area]
+            )
+            self.__dirty.discard('shapes')
+
+        sections = self.__place_sections(
+            shapes=self.__shapes, twists=[twisti[1] for twisti in self.__twist], placements=self.__placements
+        )
+        self.__cross_sections = [[points[-1], points] for points in sections.tolist()]
+
+        self.__dirty.discard('sections')
+
+        if key is not None:
+            self.__result_cache.store(key=key, sections=[section[1] for section in self.__cross_sections])
 
-        self.__cross_sections = []
+        return self.__cross_sections
+
+    @staticmethod
+    def __check_stations(lengths: list, **distributions):
+        for name, values in distributions.items():
+            if len(values) != len(lengths):
+                raise ValueError(
+                    f'{len(lengths)} {name} values expected, one per section length, {len(values)} given'
+                )
+
+    @staticmethod
+    def __euler_angles(d: list) -> tuple:
+
+        dx, dy, dz = round(d[0], 5), round(d[1], 5), round(d[2], 5)
+
+        if abs(d[0]) < PipeDiffuser.RADIAL_TOLERANCE:
+            dzdx, dydxdz = round(-math.pi / 4, 4), round(math.pi / 2, 4)
+        else:
+            dzdx = round(math.atan(dz / dx), 4)
+            dydxdz = round(math.atan(dy / (dx ** 2 + dz ** 2) ** 0.5), 4)
+
+        return dzdx, dydxdz
+
+    def __compute_placements(self, lengths: list) -> list or tuple:
+
+        if self.__frame == 'rmf':
+            return self.__compute_frames(lengths=lengths)
+
+        # Mean line frame angles and point of every section; they do not depend
+        # on the section shapes or the twist
+        placements = []
         derivatives = self.__ml_bezier.derivatives(norm_length=[l/lengths[-1] for l in lengths])
+
+        for d, lenght in zip(derivatives, lengths):
+            dzdx, dydxdz = self.__euler_angles(d=d)
+            point = self.__ml_bezier.norm_length_point(norm_length=(lenght/lengths[-1]))[1]
+            placements.append((dzdx, dydxdz, point))
+
+        return placements
+
+    def __compute_frames(self, lengths: list) -> tuple:
+
+        # Section points and rotations (local -> world) from the rotation
+        # minimizing frames of the mean line. The local z axis follows the
+        # negative tangent as in the euler frame, which also gives the local x
+        # axis of the first section
+        dzdx, dydxdz = self.__euler_angles(d=self.__ml_bezier.derivative(norm_length=0.0))
+        tetaY = math.radians(90)
+        rot_y = [math.cos(tetaY / 2 + dzdx / 2), 0.0, math.sin(tetaY / 2 + dzdx / 2), 0.0]
+        rot_z = [math.cos(dydxdz / 2), -math.sin(dydxdz / 2), 0.0, 0.0]
+        euler = transform_matrices(np.concatenate((quaternion_product(rot_z, rot_y), np.zeros(4))))
+
+        points, tangents, normals, binormals = self.__ml_bezier.frames(
+            norm_lengths=[l/lengths[-1] for l in lengths], normal=euler[:, 0]
+        )
+        rotations = np.stack((normals, -binormals, -tangents), axis=-1)
+
+        return points, rotations
+
+    def __place_sections(self, shapes: np.ndarray, twists: list, placements: list or tuple) -> np.ndarray:
+
+        # Local section shapes -> world (n_sections, 4, n_points, 3)
+        if self.__frame == 'rmf':
+            return self.__place_sections_rmf(shapes=shapes, twists=twists, placements=placements)
+        return self.__place_sections_euler(
+            shapes=shapes, twists=[round(twist, 5) for twist in twists], placements=placements
+        )
+
+    def __place_sections_euler(self, shapes: np.ndarray, twists: list, placements: list) -> np.ndarray:
+
+        self.__check_stations(lengths=shapes, twist=twists, placements=placements)
         tetaY = math.radians(90)
 
         Tr = DQ(D0=Q(scalar=1.0, vector=[0.0, 0.0, 0.0]), D1=Q())
         RotX = DQ(D0=Q(), D1=Q())
         RotY = DQ(D0=Q(), D1=Q())
         RotZ = DQ(D0=Q(), D1=Q())
-        PointDQ = DQ(D0=Q(scalar=1.0, vector=[0.0, 0.0, 0.0]), D1=Q())
-
-        for wh, area, twist, d, lenght in zip(
-                [round(whi[1], 5) for whi in self.wh], 
-                [round(areai[1], 5) for areai in self.area],
-                [round(twisti[1], 5) for twisti in self.twist],
-                derivatives,
-                self.lengths
-            ):
-            dx, dy, dz = round(d[0], 5), round(d[1], 5), round(d[2], 5)
 
-            if not dx:
-                dzdx, dydxdz = round(-math.pi / 4, 4), round(math.pi / 2, 4)
-            else:
-                dzdx = round(math.atan(dz / dx), 4)
-                dydxdz = round(math.atan(dy / (dx ** 2 + dz ** 2) ** 0.5), 4)
-
-            point = self.__ml_bezier.norm_length_point(norm_length=(lenght/self.lengths[-1]))[1]
+        sections = []
+        for shape, twist, (dzdx, dydxdz, point) in zip(shapes, twists, placements):
 
             Tr.Dual.vector = scalar_vector(scalar=0.5, vector=point)
 
@@ -301,19 +511,47 @@ class PipeDiffuser:
             RotX.Real.vector = scalar_vector(scalar=math.sin(twist / 2), vector=[0.0, 0.0, 1.0])
 
             ResDQ = RotX.mult(RotZ).mult(RotY).mult(Tr)
-            ResDQ_conj = ResDQ.conjugate()
-            points = []
 
-            for shape in self.compute_cross_section(wh=wh, area=area):
-                point = []
-                for pt in shape:
-                    PointDQ.Dual.vector = pt
-                    point.append(ResDQ_conj.mult(PointDQ).mult(ResDQ).Dual.vector)
-                points.append(point)
+            sections.append(ResDQ.transform_points(shape.reshape(-1, 3)).reshape(shape.shape))
 
-            self.__cross_sections.append([point, points])
+        return np.array(sections).reshape((len(sections),) + shapes.shape[1:])
 
-        return self.__cross_sections
+    def __place_sections_rmf(self, shapes: np.ndarray, twists: list, placements: tuple) -> np.ndarray:
+
+        # All sections at once: shape points are twisted about the local z axis,
+        # rotated into the frame and moved to the mean line point
+        points, rotations = placements
+        self.__check_stations(lengths=shapes, twist=twists, placements=points)
+        count = len(shapes)
+
+        twist = np.array(twists, dtype=float)
+        cos, sin = np.cos(twist), np.sin(twist)
+        twists = np.zeros((count, 3, 3))
+        twists[:, 0, 0], twists[:, 0, 1] = cos, sin
+        twists[:, 1, 0], twists[:, 1, 1] = -sin, cos
+        twists[:, 2, 2] = 1.0
+
+        local = shapes.reshape(count, -1, 3)
+        world = np.einsum('nij,nkj->nki', rotations @ twists, local) + points[:, None, :]
+
+        return world.reshape(shapes.shape)
+
+    def sample_sections(self, lengths: list, wh: list, area: list, twist: list, arc_points: int=None) -> np.ndarray:
+
+        # Placed sections at arbitrary mean line lengths with the given wh, area
+        # and twist values, e.g. for dense meshing; the cached stages and
+        # cross_sections are left untouched
+        if self.__ml_bezier is None or 'mean_line' in self.__dirty:
+            self.compute_mean_line()
+
+        self.__check_stations(lengths=lengths, wh=wh, area=area, twist=twist)
+        lengths = list(lengths)
+        shapes = self.compute_section_shapes(
+            wh=[round(whi, 5) for whi in wh], area=[round(ai, 5) for ai in area], num_points=arc_points
+        )
+        placements = self.__compute_placements(lengths=lengths)
+
+        return self.__place_sections(shapes=shapes, twists=list(twist), placements=placements)
 
     def get_tangents(self, norm_length: list=[0.0, 1.0]):
 
@@ -0,0 +1,314 @@
+import os
+import json
+import math
+import logging
+
+import utils.p1112_parser as p1112
+
+from utils.cache import InputCache, ResultCache
+
+from mathlib.math import linspace
+from mathlib.bezier import BezierThroughPoints
+from mathlib.line_interpolation import LineInterpolation
+from diffuser.pipe_diffuser import PipeDiffuser
+from diffuser.mesh import surface_grid, write_stl, write_plot3d
+
+
+UNITS = 25.4
+
+DISTRIBUTIONS = {
+    'xr': r'x-r\s+\w+',
+    'xbeta': r'x-beta\s+\w+',
+    'wh': r'w\W+h\s+\w+',
+    'area': r'area\s+\w+',
+    'twist': r'twist\s+\w+'
+}
+
+logger = logging.getLogger(__name__)
+
+
+def parse_p1112(indata_file: str) -> dict:
+
+    if not os.path.exists(indata_file):
+        raise FileNotFoundError('File {file} doesn\'t exist'.format(file=os.path.abspath(indata_file)))
+
+    p1112_data = p1112.read_p1112(in_file=indata_file)
+
+    data = {'indata': p1112_data.input_parameters}
+    for name, pattern in DISTRIBUTIONS.items():
+        data[name] = p1112_data.distribution(string=pattern)
+
+    data['area'] = area_distribution(area=data['area'])
+    return data
+
+
+def load_inputs(indata_file: str, cache: InputCache=None) -> dict:
+
+    # Parsed data comes from the cache when the file contents are known; it may
+    # then also carry the solved x-r / x-beta splines under 'splines'
+    if cache is not None and os.path.exists(indata_file):
+        data = cache.load(in_file=indata_file)
+        if data is not None:
+            logger.debug(f'{indata_file}: inputs loaded from cache')
+            return data
+
+    return parse_p1112(indata_file=indata_file)
+
+
+def solve_splines(data: dict) -> dict:
+    return {
+        name: BezierThroughPoints(points=data[name], npoints=2).state.control_points
+        for name in ('xr', 'xbeta')
+    }
+
+
+def store_inputs(indata_file: str, data: dict, result: dict, cache: InputCache=None):
+
+    if cache is not None and 'splines' not in data:
+        cache.store(in_file=indata_file, data=data, splines=result['splines'])
+
+
+def area_distribution(area: list) -> list:
+
+    # The first two area points are joined with a linear radius distribution
+    radius_dist = [(a[1] / math.pi) ** 0.5 for a in area[:2]]
+    radius = linspace(start=radius_dist[0], stop=radius_dist[1], num_points=51)
+    length = linspace(start=area[0][0], stop=area[1][0], num_points=51)
+
+    area_dist = [[l, math.pi * r ** 2] for l, r in zip(length, radius)]
+    area_dist.extend(area[2:])
+
+    return area_dist
+
+
+def compute_mean_line(data: dict, num_sec: int, overrides: dict=None, frame: str='euler') -> dict:
+
+    if not num_sec:
+        raise ValueError('Number of section can\'t be equal 0')
+
+    splines = data.get('splines', {})
+    xr_bezier = BezierThroughPoints(points=data['xr'], npoints=2, control_points=splines.get('xr'))
+    xbeta_bezier = BezierThroughPoints(points=data['xbeta'], npoints=2, control_points=splines.get('xbeta'))
+
+    norm_length = linspace(start=0.0, stop=1.0, num_points=num_sec)
+    xr_points = xr_bezier.points_at_normalized_lengths(norm_length).tolist()
+    xr_points = [[abs(round(xri[0], 4)), abs(round(xri[1], 4))] for xri in xr_points]
+
+    # A few x-beta segments overshoot in x; their first monotone piece is used
+    xi = [p[0] for p in xr_points]
+    xbeta_points = xbeta_bezier.interpolate(points=(0, xi), strict=False)
+    xbeta_points = [[round(b[0], 4), round(b[1], 4)] for b in xbeta_points]
+
+    indata = data['indata']
+    diffuser_params = {
+        'xr': xr_points,
+        'xbeta': xbeta_points,
+        'length_star': float(indata['len_star']),
+        'del_length_star': float(indata['del_len_star']),
+        'rimp': float(indata['imp_tan_rad']),
+        'radial_gap': float(indata['radial_gap']),
+        'r_exit_case': float(indata['r_exit_case']),
+        'frame': frame
+    }
+    if overrides:
+        diffuser_params.update(overrides)
+
+    pipe_diffuser = PipeDiffuser(**diffuser_params)
+    mean_line = pipe_diffuser.compute_mean_line()
+    mean_line = [[round(p[0], 4), round(p[1], 4), round(p[2], 4)] for p in mean_line]
+    mean_line_length = pipe_diffuser.get_mean_line_length()
+
+    return {
+        'diffuser': pipe_diffuser,
+        'norm_length': norm_length,
+        'length': [mean_line_length * nl for nl in norm_length],
+        'mean_line': mean_line,
+        'splines': {
+            'xr': xr_bezier.state.control_points,
+            'xbeta': xbeta_bezier.state.control_points
+        }
+    }
+
+
+def interpolate_distribution(data: dict, name: str, length: list) -> list:
+
+    # Distribution values at every section length; a distribution not covering
+    # the whole mean line is an error rather than fewer sections
+    try:
+        return LineInterpolation(points=data[name]).interpolate(points=length, mode='raise')
+    except ValueError as ex:
+        raise ValueError(f'{name} distribution does not cover the mean line length {length[-1]}: {ex}')
+
+
+def compute_cross_sections(data: dict, result: dict, cache: ResultCache=None) -> dict:
+
+    length = result['length']
+    pipe_diffuser = result['diffuser']
+
+    wh_points = interpolate_distribution(data=data, name='wh', length=length)
+    area_points = interpolate_distribution(data=data, name='area', length=length)
+    twist_points = interpolate_distribution(data=data, name='twist', length=length)
+
+    pipe_diffuser.lengths = length
+    pipe_diffuser.wh = wh_points
+    pipe_diffuser.area = area_points
+    pipe_diffuser.twist = twist_points
+    pipe_diffuser.result_cache = cache
+
+    result['wh'] = wh_points
+    result['area'] = area_points
+    result['twist'] = twist_points
+    result['cross_sections'] = pipe_diffuser.compute_cross_sections()
+
+    return result
+
+
+def write_outputs(result: dict, outdata_dir: str, prt_file: str, units: float=UNITS) -> dict:
+
+    os.makedirs(outdata_dir, exist_ok=True)
+
+    prt_file_name = os.path.splitext(os.path.split(prt_file)[1])[0]
+    files = {
+        'json': os.path.join(outdata_dir, f'{prt_file_name}_json_data.json'),
+        'mean_line': os.path.join(outdata_dir, f'{prt_file_name}_mean_line.dat'),
+        'cross_sections': os.path.join(outdata_dir, f'{prt_file_name}_cross_sections.dat'),
+        'area': os.path.join(outdata_dir, f'{prt_file_name}_area.dat')
+    }
+
+    with open(files['mean_line'], 'w') as f:
+        for point in result['mean_line']:
+            f.write(
+                f'{round(point[0] * units, 4)},{round(point[1] * units, 4)},' \
+                f'{round(point[2] * units, 4)}\n'
+            )
+
+    with open(files['cross_sections'], 'w') as f:
+        for si, section in enumerate(result['cross_sections'], 1):
+            f.write(f'Section {si}\n')
+            for i, shape in enumerate(section[1]):
+                if i in [0, 1, 2, 3]:
+                    f.write('Arc\n')
+                else:
+                    f.write('Line\n')
+                for points in shape:
+                    f.write(
+                        f'{round(points[0] * units, 4)},{round(points[1] * units, 4)},' \
+                        f'{round(points[2] * units, 4)}\n'
+                    )
+
+    json_outdata = {
+        "twist": result['twist'],
+        "mean_line": result['mean_line'],
+        "cross_sections": result['cross_sections'],
+        "prt": os.path.normpath(prt_file)
+    }
+    with open(files['json'], 'w') as fo:
+        json.dump(json_outdata, fo)
+
+    with open(files['area'], 'w') as fo:
+        for area in result['area']:
+            fo.write(f'{area[0]},{area[1]}\n')
+
+    return files
+
+
+def write_mesh(data: dict, result: dict, outdata_dir: str, prt_file: str, stations: int=200,
+               points: int=64, units: float=UNITS) -> dict:
+
+    # Structured surface grid of the passage written as binary STL and PLOT3D
+    os.makedirs(outdata_dir, exist_ok=True)
+    prt_file_name = os.path.splitext(os.path.split(prt_file)[1])[0]
+    grid = surface_grid(data=data, result=result, stations=stations, points=points)
+
+    return {
+        'stl': write_stl(
+            file=os.path.join(outdata_dir, f'{prt_file_name}_surface.stl'),
+            grid=grid, units=units, name=prt_file_name
+        ),
+        'plot3d': write_plot3d(
+            file=os.path.join(outdata_dir, f'{prt_file_name}_surface.xyz'), grids=[grid], units=units
+        )
+    }
+
+
+def plot_charts(result: dict, pic_dir: str, prt_file_name: str) -> list:
+
+    # matplotlib is imported only when charts are requested
+    import matplotlib.pyplot as plt
+    from chart.chart import PlotData
+
+    os.makedirs(pic_dir, exist_ok=True)
+    area_points = result['area']
+    norm_length = result['norm_length']
+    length = result['length']
+    pictures = []
+
+    # Norm Area (Ai/A1) distriburtion
+    a1 = area_points[0][1]
+    a_norm_distr = [[nl, a[1] / a1] for a, nl in zip(area_points, norm_length)]
+    fn = os.path.join(pic_dir, f'{prt_file_name}_area_dist.jpg')
+
+    x_major_ticks = [a[1] for a in a_norm_distr]
+    chart = PlotData(data=a_norm_distr,
+        marker='s', color='b', markerfacecolor='b',
+        title='Norm Length vs Norm Area (Ai/A1)', axis_labels=['Norm length', 'Norm Area'],
+        major_ticks=[linspace(0.0, 1.0, 11), linspace(1, math.ceil(max(x_major_ticks)), 11)]
+    )
+    fig, ax = chart.plt_2Dgraph()
+    fig.set_size_inches(10, 10)
+    plt.savefig(fn, dpi=300, bbox_inches="tight", pad_inches=1)
+    pictures.append(fn)
+
+    # ECA
+    fn = os.path.join(pic_dir, f'{prt_file_name}_eca.jpg')
+    eca = [
+        [nl, (2 * math.degrees(math.atan((ai1[1] ** 0.5 - ai[1] ** 0.5) / math.pi ** 0.5) / (li1 - li) ))]
+        for ai1, ai, li1, li, nl in zip(area_points[1:], area_points, length[1:], length, norm_length)
+    ]
+    x_major_ticks = [e[1] for e in eca]
+    chart = PlotData(
+        data=eca, marker_color='r',
+        marker='s', color='r', markerfacecolor='r',
+        title='Norm Length vs ECA(LOC)', axis_labels=['Norm Length', 'ECA(LOC)'],
+        major_ticks=[
+            linspace(0.0, 1.0, 11),
+            linspace(math.floor(min(x_major_ticks)), math.ceil(max(x_major_ticks)), 11)
+        ]
+    )
+    fig, ax = chart.plt_2Dgraph()
+    fig.set_size_inches(10, 10)
+    plt.savefig(fn, dpi=300, bbox_inches="tight", pad_inches=1)
+    pictures.append(fn)
+
+    return pictures
+
+
+def run(indata_file: str, num_sec: int, outdata_dir: str, prt_file: str='', charts: bool=False,
+        cache: InputCache=None, result_cache: ResultCache=None, frame: str='euler',
+        mesh: tuple=None) -> dict:
+
+    if not prt_file:
+        name = os.path.splitext(os.path.split(indata_file)[1])[0]
+        prt_file = os.path.abspath(os.path.join(outdata_dir, f'{name}.prt'))
+
+    data = load_inputs(indata_file=indata_file, cache=cache)
+    result = compute_mean_line(data=data, num_sec=num_sec, frame=frame)
+    store_inputs(indata_file=indata_file, data=data, result=result, cache=cache)
+    result = compute_cross_sections(data=data, result=result, cache=result_cache)
+    result['files'] = write_outputs(result=result, outdata_dir=outdata_dir, prt_file=prt_file)
+
+    if mesh:
+        stations, points = mesh
+        result['files'].update(write_mesh(
+            data=data, result=result, outdata_dir=outdata_dir, prt_file=prt_file,
+            stations=stations, points=points
+        ))
+
+    if charts:
+        prt_file_name = os.path.splitext(os.path.split(prt_file)[1])[0]
+        result['pictures'] = plot_charts(
+            result=result, pic_dir=os.path.join(outdata_dir, 'pictures'), prt_file_name=prt_file_name
+        )
+
+    logger.info(f'{indata_file}: {num_sec} sections written to {outdata_dir}')
+    return result
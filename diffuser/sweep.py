@@ -0,0 +1,117 @@
+import os
+import json
+import itertools
+import logging
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import diffuser.pipeline as pipeline
+
+from utils.cache import InputCache, ResultCache
+
+
+SCALAR_PARAMETERS = ('length_star', 'del_length_star', 'rimp', 'radial_gap', 'r_exit_case')
+DISTRIBUTION_PARAMETERS = ('wh', 'area', 'twist')
+
+logger = logging.getLogger(__name__)
+
+# Parsed p1112 data and the result cache shared by every task of a worker process
+_worker_data = {}
+_worker_cache = {}
+
+
+def parameter_grid(**params) -> list:
+    # parameter_grid(rimp=[7.0, 7.4], wh=[wh1, wh2]) -> list of override dicts
+    names = list(params.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*params.values())]
+
+
+def check_overrides(overrides: dict):
+    for name in overrides:
+        if name not in SCALAR_PARAMETERS + DISTRIBUTION_PARAMETERS:
+            raise ValueError(f'Unknown sweep parameter {name}')
+
+
+def evaluate_variant(data: dict, overrides: dict, num_sec: int, result_cache: ResultCache=None) -> dict:
+
+    # Distributions (wh, area, twist) replace the parsed ones and are given as
+    # in the p1112 file: an area override is expanded by area_distribution like
+    # the parsed table. They must cover the whole mean line length. Scalars
+    # override the PipeDiffuser parameters taken from the p1112 file
+    check_overrides(overrides)
+    variant = dict(data)
+    variant.update({k: v for k, v in overrides.items() if k in DISTRIBUTION_PARAMETERS})
+    if 'area' in overrides:
+        variant['area'] = pipeline.area_distribution(area=overrides['area'])
+    scalars = {k: v for k, v in overrides.items() if k in SCALAR_PARAMETERS}
+
+    result = pipeline.compute_mean_line(data=variant, num_sec=num_sec, overrides=scalars)
+    result = pipeline.compute_cross_sections(data=variant, result=result, cache=result_cache)
+
+    return {
+        'overrides': overrides,
+        'mean_line_length': result['length'][-1],
+        'mean_line': result['mean_line'],
+        'twist': result['twist'],
+        'cross_sections': result['cross_sections']
+    }
+
+
+def _init_worker(data: dict, result_cache: ResultCache=None):
+    _worker_data.clear()
+    _worker_data.update(data)
+    _worker_cache['result'] = result_cache
+
+
+def _run_variant(index: int, overrides: dict, num_sec: int, outdir: str) -> tuple:
+
+    out_file = os.path.join(outdir, f'variant_{index:05d}.json')
+    try:
+        variant = evaluate_variant(
+            data=_worker_data, overrides=overrides, num_sec=num_sec, result_cache=_worker_cache.get('result')
+        )
+    except Exception as ex:
+        # Any failure of a variant, malformed overrides included, is recorded in
+        # the index instead of stopping the sweep
+        return index, '', f'{type(ex).__name__}: {ex}'
+
+    with open(out_file, 'w') as fo:
+        json.dump(variant, fo)
+
+    return index, out_file, ''
+
+
+def run_sweep(indata_file: str, variants: list, num_sec: int, outdir: str, workers: int=None,
+              cache: InputCache=None, result_cache: ResultCache=None) -> list:
+
+    # The p1112 file is parsed and its splines solved once, shipped to every worker at start-up and each
+    # variant is written to disk by the worker as soon as it is computed.
+    # sweep_index.jsonl gets one line per finished variant in completion order
+    data = pipeline.load_inputs(indata_file=indata_file, cache=cache)
+    if 'splines' not in data:
+        data['splines'] = pipeline.solve_splines(data=data)
+        if cache is not None:
+            cache.store(in_file=indata_file, data=data, splines=data['splines'])
+    for overrides in variants:
+        check_overrides(overrides)
+
+    os.makedirs(outdir, exist_ok=True)
+    index_file = os.path.join(outdir, 'sweep_index.jsonl')
+    records = []
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data, result_cache)) as executor, \
+            open(index_file, 'w') as fi:
+        futures = [
+            executor.submit(_run_variant, index, overrides, num_sec, outdir)
+            for index, overrides in enumerate(variants)
+        ]
+        for future in as_completed(futures):
+            index, out_file, error = future.result()
+            record = {'index': index, 'overrides': variants[index], 'file': out_file, 'error': error}
+            if error:
+                logger.error(f'Variant {index} failed: {error}')
+            fi.write(json.dumps(record) + '\n')
+            fi.flush()
+            records.append(record)
+
+    return sorted(records, key=lambda record: record['index'])
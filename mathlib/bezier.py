@@ -1,7 +1,52 @@
+import numpy as np
+
+from functools import lru_cache
+from math import comb
+
 from mathlib.math import *
 from mathlib.matrix import *
-from mathlib.gaussian_quadrature import GQ as gq
+from mathlib.gaussian_quadrature import GQ as gq, gauss_kronrod
 from mathlib.vector import normed, scalar_vector
+from mathlib.frames import rotation_minimizing_frames
+
+
+def bernstein_matrix(degree: int, t) -> np.ndarray:
+    # Row k holds the Bernstein basis B(degree, i, t[k]) for i = 0..degree
+    t = np.asarray(t, dtype=float).reshape(-1, 1)
+    i = np.arange(degree + 1)
+    binomial = np.array([comb(degree, k) for k in i], dtype=float)
+    return binomial * t ** i * (1.0 - t) ** (degree - i)
+
+
+@lru_cache(maxsize=128)
+def linspace_bernstein_matrix(degree: int, npoints: int, start: float=0.0, stop: float=1.0) -> np.ndarray:
+    basis = bernstein_matrix(degree, linspace(start, stop, npoints))
+    basis.flags.writeable = False
+    return basis
+
+
+@lru_cache(maxsize=32)
+def power_basis_matrix(degree: int) -> np.ndarray:
+    # Maps Bezier control points to power basis coefficients (ascending powers of t)
+    matrix = np.zeros((degree + 1, degree + 1))
+    for j in range(degree + 1):
+        for i in range(j + 1):
+            matrix[j][i] = comb(degree, j) * comb(j, i) * (-1) ** (j - i)
+    matrix.flags.writeable = False
+    return matrix
+
+
+def horner(coefficients, t) -> np.ndarray:
+    # Scalar t -> (dim,) point, array of N parameters -> (N, dim) points
+    coefficients = np.asarray(coefficients, dtype=float)
+    t = np.asarray(t, dtype=float)
+    if t.ndim and coefficients.ndim > 1:
+        t = t.reshape(-1, 1)
+    result = np.zeros(np.broadcast(t, coefficients[-1]).shape) + coefficients[-1]
+    for c in coefficients[-2::-1]:
+        result = result * t + c
+    return result
+
 
 class BaseBezier:
 
@@ -10,13 +55,29 @@ class BaseBezier:
         self.__degree = len(self.__points) - 1
         self.__space_dimention = len(self.__points[0])
         self.__npoints = kwargs.get('npoints', 50)
+        self.__table_size = kwargs.get('table_size', 32)
         self.__first_point = self.__points[0]
         self.__last_point = self.__points[-1]
+        self.__control = np.array(self.__points, dtype=float)
+        self.__control.flags.writeable = False
+        self.__coefficients = None
+        self.__derivative_coefficients = None
+        self.__monotone = {}
+        self.__arc_length_table = None
 
     @property
     def points(self):
         return self.__points
 
+    @points.setter
+    def points(self, points: list):
+        if hasattr(points, '__iter__'):
+            self.__init__(points=points, npoints=self.num_points, table_size=self.__table_size)
+
+    @property
+    def control_points(self) -> np.ndarray:
+        return self.__control
+
     @property
     def degree(self):
         return self.__degree
@@ -38,155 +99,337 @@ class BaseBezier:
         return self.__last_point
 
     def _binomial_coefficient(self, n: int, i: int) -> float:
-        return factorial(n) / (factorial(i) * factorial(n - i))
+        return float(comb(n, i))
 
     def _Bernstein_polynomial(self, n: int, i: int, t: float) -> float:
         return self._binomial_coefficient(n, i) * t ** i * (1 - t) ** (n - i)
 
     def _get_coordinates(self, n: int, t: float, points: list) -> list:
-        coordinates = [0] * self.dimention
+        return (bernstein_matrix(n, t) @ np.asarray(points, dtype=float))[0].tolist()
 
-        for i in range(n + 1):
-            for d in range(self.dimention):
-                coordinates[d] += self._Bernstein_polynomial(n ,i, t) * points[i][d]
+    def evaluate(self, t) -> np.ndarray:
+        # Batched evaluation: array of N parameters -> (N, dim) array of points
+        return bernstein_matrix(self.degree, t) @ self.__control
 
-        return coordinates
+    @property
+    def coefficients(self) -> np.ndarray:
+        if self.__coefficients is None:
+            self.__coefficients = power_basis_matrix(self.degree) @ self.__control
+            self.__coefficients.flags.writeable = False
+        return self.__coefficients
+
+    @property
+    def derivative_coefficients(self) -> np.ndarray:
+        if self.__derivative_coefficients is None:
+            c = self.coefficients
+            self.__derivative_coefficients = np.arange(1, len(c)).reshape(-1, 1) * c[1:]
+            self.__derivative_coefficients.flags.writeable = False
+        return self.__derivative_coefficients
+
+    @property
+    def arc_length_table(self) -> tuple:
+        # Cumulative arc length s(t) sampled on a uniform t grid, built once per curve
+        if self.__arc_length_table is None:
+            t = np.linspace(0.0, 1.0, self.__table_size + 1)
+            s = np.concatenate(([0.0], np.cumsum(self.__integrate_speed(t[:-1], t[1:]))))
+            t.flags.writeable = False
+            s.flags.writeable = False
+            self.__arc_length_table = (t, s)
+        return self.__arc_length_table
+
+    @property
+    def arc_length(self) -> float:
+        return float(self.arc_length_table[1][-1])
 
     def get_polynomial_coefficients(self) -> list:
+        return self.coefficients.tolist()
 
-        c = []
-        n = self.degree
-        cols = self.dimention
-        for j in range(0, n + 1):
-            ci = [0] * cols
-            binom = factorial(n) / factorial(n - j)
-            for i in range(j + 1):
-                polynom = ((-1) ** (i + j)) / (factorial(i) * factorial(j - i))
-                for col in range(cols):
-                    ci[col] += binom * polynom * self.points[i][col]
-            c.append(ci)
-        return c
-                    
     def get_point(self, t: float=0) -> list:
-        coef = self.get_polynomial_coefficients()
-        point = coef[0]
-        for i, c in enumerate(coef[1:], 1):
-            for j, ci in enumerate(c):
-                point[j] += ci * t ** i
-        
-        return point
+        return horner(self.coefficients, t).tolist()
 
     def get_points(self, t: list) -> list:
-        return [self.get_point(ti) for ti in t]
-
-    def get_length(self, n: int=5, t1: float=0.0, t2: float=1.0):
-        w = gq[n][0]
-        x = gq[n][1]
-        length = 0.0
-        for i in range(n):
-            ti = (t2 - t1) * x[i] / 2 + (t2 - t1) / 2
-            ft = sum([p ** 2 for p in self.derivative(t=ti)]) ** 0.5
-            length += w[i] * ft
-        length *= (t2 - t1) / 2
-        return length
+        return horner(self.coefficients, t).tolist()
+
+    def get_length(self, n: int=5, t1: float=0.0, t2: float=1.0, tol: float=None):
+        # n-point Gauss-Legendre rule, or adaptive Gauss-Kronrod when tol is given
+        if tol is not None:
+            return float(self.get_lengths(t1=t1, t2=t2, tol=tol))
+        return float(self.__integrate_speed(t1, t2, n=n))
+
+    def get_lengths(self, t1=0.0, t2=1.0, tol: float=10**-10) -> np.ndarray:
+        # Arc lengths over every interval [t1[i], t2[i]] to an absolute tolerance
+        return gauss_kronrod(self.__speed, t1, t2, tol=tol)[0]
 
     def get_coordinates(self, npoints: int = 0, start: float=0.0, stop: float=1.0) -> list:
         if not npoints:
             npoints = self.num_points
-        points = [0] * npoints
-        t = linspace(start, stop, npoints)
-        for i, ti in enumerate(t):
-            points[i] = self._get_coordinates(self.degree, ti, self.points)
-        
-        return points
+        basis = linspace_bernstein_matrix(self.degree, npoints, start, stop)
+        return (basis @ self.__control).tolist()
+
+    def get_t(self, point: tuple([0, 0.0]), start: float=0.0, stop: float=1.0, eps: float=10**-3,
+              strict: bool=True) -> float:
+
+        axis, value = point[0], point[1]
+
+        if abs(self.get_point(t=start)[axis] - value) <= eps:
+            return start
+        elif abs(self.get_point(t=stop)[axis] - value) <= eps:
+            return stop
+
+        return self.solve_t(values=value, axis=axis, start=start, stop=stop, strict=strict)
+
+    def monotone_knots(self, axis: int=0, start: float=0.0, stop: float=1.0) -> np.ndarray:
+
+        # Parameters splitting [start, stop] into pieces where the coordinate
+        # is monotone: the hodograph roots where its sign actually changes
+        key = (axis, start, stop)
+        if key not in self.__monotone:
+            knots = np.array([start, stop], dtype=float)
+            dc = self.derivative_coefficients[:, axis] if self.degree >= 1 else np.zeros(1)
+            if np.any(dc):
+                roots = np.roots(dc[::-1])
+                roots = np.sort(roots[np.abs(roots.imag) <= 10**-12].real)
+                knots = np.concatenate(([start], roots[(roots > start) & (roots < stop)], [stop]))
+                signs = np.sign(horner(dc, 0.5 * (knots[:-1] + knots[1:])))
+                turns = [k for k in range(1, len(knots) - 1) if signs[k - 1] * signs[k] < 0]
+                knots = knots[[0] + turns + [len(knots) - 1]]
+            knots.flags.writeable = False
+            self.__monotone[key] = knots
+
+        return self.__monotone[key]
+
+    def is_monotone(self, axis: int=0, start: float=0.0, stop: float=1.0) -> bool:
+        return len(self.monotone_knots(axis=axis, start=start, stop=stop)) == 2
+
+    def solve_t(self, values, axis: int=0, tol: float=10**-10, max_iter: int=50,
+                start: float=0.0, stop: float=1.0, strict: bool=True):
+        # Inverse evaluation: coordinate value(s) along axis -> curve parameter(s).
+        # Safeguarded Newton on the analytic derivative, falling back to bisection
+        # whenever the Newton step leaves the current bracket. A non-monotone
+        # coordinate raises ValueError, unless strict is False: then the first
+        # monotone piece holding the value is used
+
+        values = np.asarray(values, dtype=float)
+        v = np.atleast_1d(values).astype(float)
+        c = self.coefficients[:, axis]
+        x0, x1 = float(horner(c, start)), float(horner(c, stop))
+
+        t = np.full(v.shape, np.nan)
+        t[np.abs(x0 - v) <= tol] = start
+        t[np.isnan(t) & (np.abs(x1 - v) <= tol)] = stop
+        todo = np.isnan(t)
+
+        if todo.any():
+            knots = self.monotone_knots(axis=axis, start=start, stop=stop)
+            if strict and len(knots) > 2:
+                raise ValueError(
+                    f'Coordinate {axis} is not monotone on the curve for t in [{start}, {stop}]'
+                )
+            xk = horner(c, knots)
+            lower = np.minimum(xk[:-1], xk[1:]) - tol
+            upper = np.maximum(xk[:-1], xk[1:]) + tol
+            inside = (v[todo, None] >= lower) & (v[todo, None] <= upper)
+            if not np.all(inside.any(axis=1)):
+                raise ValueError(
+                    f'Coordinate {axis} value is out of the curve range [{xk.min()}, {xk.max()}]'
+                )
+            piece = np.argmax(inside, axis=1)
+            solved = np.zeros(piece.shape)
+            for k in np.unique(piece):
+                members = piece == k
+                solved[members] = self.__newton(
+                    c=c, dc=self.derivative_coefficients[:, axis], values=v[todo][members],
+                    x0=float(xk[k]), x1=float(xk[k + 1]), tol=tol, max_iter=max_iter,
+                    start=float(knots[k]), stop=float(knots[k + 1])
+                )
+            t[todo] = solved
+
+        return t if values.ndim else float(t[0])
+
+    @staticmethod
+    def __newton(c, dc, values, x0, x1, tol, max_iter, start, stop) -> np.ndarray:
+
+        sign = 1.0 if x1 >= x0 else -1.0
+        lo = np.full(values.shape, start)
+        hi = np.full(values.shape, stop)
+        t = start + (stop - start) * (values - x0) / (x1 - x0)
+
+        for _ in range(max_iter):
+            f = sign * (horner(c, t) - values)
+            lo = np.where(f < 0, t, lo)
+            hi = np.where(f > 0, t, hi)
+            active = (np.abs(f) > tol) & (hi - lo > tol)
+            if not active.any():
+                break
+            with np.errstate(divide='ignore', invalid='ignore'):
+                step = t - f / (sign * horner(dc, t))
+            step = np.where((step > lo) & (step < hi), step, 0.5 * (lo + hi))
+            t = np.where(active, step, t)
+
+        return t
 
-    def get_t(self, point: tuple([0, 0.0]), start: float=0.0, stop: float=1.0, eps: float=10**-3) -> float:
+    def derivative(self, t: float=0.0):
+        if self.degree <= 1:
+            return 0.0
+        return horner(self.derivative_coefficients, t).tolist()
 
-        left = self.get_point(t=0.0)[point[0]]
-        rigth = self.get_point(t=1.0)[point[0]]
+    def get_length_point(self, length: float=0.0, t1: float = 0.0, t2: float = 1.0):
 
-        t = linspace(start, stop, 1000)
-        mid = self.get_point(t=t[int(len(t)/2)])[point[0]]
+        try:
+            t = self.t_at_length(length=length)
+        except ValueError:
+            return False
+        return t, self.get_point(t=t)
+
+    def t_at_length(self, length, tol: float=10**-12, max_iter: int=8):
+        # Arc length(s) -> curve parameter(s): binary search in the arc length table,
+        # monotone linear inverse interpolation and Newton polishing on s(t) - length
+
+        t_table, s_table = self.arc_length_table
+        total = s_table[-1]
+        eps = 10**-9 * max(total, 1.0)
+
+        length = np.asarray(length, dtype=float)
+        s = np.atleast_1d(length)
+        if np.any((s < -eps) | (s > total + eps)):
+            raise ValueError(f'Length is out of the curve length range [0.0, {total}]')
+        s = np.clip(s, 0.0, total)
+
+        k = np.clip(np.searchsorted(s_table, s, side='right') - 1, 0, len(t_table) - 2)
+        t0, t1 = t_table[k], t_table[k + 1]
+        s0, s1 = s_table[k], s_table[k + 1]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.where(s1 > s0, t0 + (t1 - t0) * (s - s0) / (s1 - s0), t0)
+            for _ in range(max_iter):
+                f = s0 + self.__integrate_speed(t0, t) - s
+                if np.all(np.abs(f) <= tol * max(total, 1.0)):
+                    break
+                step = t - f / self.__speed(t)
+                t = np.clip(np.where(np.isfinite(step), step, t), t0, t1)
+
+        return t if length.ndim else float(t[0])
+
+    def points_at_normalized_lengths(self, norm_lengths) -> np.ndarray:
+        return self.evaluate(self.t_at_length(np.asarray(norm_lengths, dtype=float) * self.arc_length))
+
+    def __speed(self, t) -> np.ndarray:
+        t = np.asarray(t, dtype=float)
+        hodograph = horner(self.derivative_coefficients, t.ravel())
+        return np.linalg.norm(hodograph, axis=1).reshape(t.shape)
+
+    def __integrate_speed(self, t1, t2, n: int=5) -> np.ndarray:
+        # Gauss-Legendre integral of |B'(t)| over every interval [t1[i], t2[i]] at once
+        w, x = gq[n]
+        t1, t2 = np.asarray(t1, dtype=float), np.asarray(t2, dtype=float)
+        half, mid = 0.5 * (t2 - t1), 0.5 * (t2 + t1)
+        nodes = mid[..., None] + half[..., None] * x
+        return half * (self.__speed(nodes) @ w)
 
-        if abs(left - point[1]) <= eps:
-            return 0.0
-        elif abs(rigth - point[1]) <= eps:
-            return 1.0
-        elif abs(mid - point[1]) <= eps:
-            return t[int(len(t) / 2)]
-        else:
-            start = t[0] if mid > point[1] else t[int(len(t) / 2)]
-            stop = t[int(len(t) / 2)] if mid > point[1] else t[len(t) - 1]
-            return self.get_t(point, start=start, stop=stop)
-        
-    def derivative(self, t: float=0.0):
-        n = self.degree
-        if n <= 1:
-            return 0.0
-        else:
-            point = [(1 - t) ** (n - 1) * (p2 - p1) for p1, p2 in zip(self.points[0], self.points[1])]
+    def __repr__(self):
+        return 'BaseBezier\ndegree {degree};\n' \
+               'Points: {points}\n'.format(degree=self.degree, points=self.points)
 
-        for i in range(1, n):
-            for d in range(self.dimention):
-                point[d] += self._Bernstein_polynomial(n=(n - 1), i=i, t=t) * \
-                    (self.points[i+1][d] - self.points[i][d])
-        
-        return [n * p for p in point]
 
-    def get_length_point(self, length: float=0.0, t1: float = 0.0, t2: float = 1.0):
-        eps = 10 ** -3
+class SplineState:
 
-        if (length - 0) <= eps:
-            return 0.0, self.get_point(t=0.0)
-        elif abs(length - self.get_length()) <= eps:
-            return 1.0, self.get_point(t=1.0)
+    # Immutable solved state of a BezierThroughPoints: segment control points,
+    # segment curves and their lengths
 
-        cur_len = 0.0
-        count = 0.0
-        max_count = 10 ** 5
+    def __init__(self, control_points: list):
+        self.__control_points = tuple(tuple(tuple(p) for p in curve) for curve in control_points)
+        self.__curves = tuple(BaseBezier(points=[list(p) for p in curve]) for curve in self.__control_points)
+        self.__lengths = tuple(curve.arc_length for curve in self.__curves)
+        self.__cumulative_lengths = np.concatenate(([0.0], np.cumsum(self.__lengths)))
+        self.__cumulative_lengths.flags.writeable = False
+        self.__frames = {}
 
-        while abs(cur_len - length) > eps:
-            if length > cur_len:
-                t2 = t2 + 0.1 * t2
-            elif length < cur_len:
-                t2 = t2 - 0.1 * t2
+        # Segment end points per axis (knots) for the segment lookup by coordinate
+        knots = [curve[0] for curve in self.__control_points] + [self.__control_points[-1][-1]]
+        self.__knots = np.array(knots, dtype=float).T.copy()
+        self.__knots.flags.writeable = False
+        self.__ascending = tuple(bool(np.all(np.diff(axis) >= 0)) for axis in self.__knots)
 
-            cur_len = self.get_length(t1=0.0, t2=t2)
-            count += 1
-            if count > max_count:
-                return False
-        return t2, self.get_point(t=t2)
+    @property
+    def control_points(self) -> tuple:
+        return self.__control_points
 
-    def __repr__(self):
-        return 'BaseBezier\ndegree {degree};\n' \
-               'Points: {points}\n'.format(degree=self.degree, points=self.points)
+    @property
+    def curves(self) -> tuple:
+        return self.__curves
+
+    @property
+    def lengths(self) -> tuple:
+        return self.__lengths
+
+    @property
+    def cumulative_lengths(self) -> np.ndarray:
+        return self.__cumulative_lengths
+
+    @property
+    def length(self) -> float:
+        return float(self.__cumulative_lengths[-1])
+
+    @property
+    def frames(self) -> dict:
+        # Frame fields computed on this state, dropped together with it
+        return self.__frames
+
+    @property
+    def knots(self) -> np.ndarray:
+        return self.__knots
+
+    def span(self, axis: int, values) -> np.ndarray:
+
+        # Index of the segment holding each coordinate value, -1 if none does.
+        # Non-decreasing knots are searched by bisection; otherwise the first
+        # segment with knots[i] <= value <= knots[i + 1] is taken, as span does
+        knots = self.__knots[axis]
+        values = np.atleast_1d(np.asarray(values, dtype=float))
+        if self.__ascending[axis]:
+            return sorted_span(values, knots)
+
+        inside = (knots[:-1] <= values[:, None]) & (values[:, None] <= knots[1:])
+        return np.where(inside.any(axis=1), inside.argmax(axis=1), -1)
 
 
 class BezierThroughPoints(BaseBezier):
 
-    def __init__(self, points: list, *args, **kwargs):
+    def __init__(self, points: list, *args, control_points: list=None, **kwargs):
         super().__init__(points=points, *args, **kwargs)
-        self.curves = []
         self.__degree = 3
         self.__dim = 2 + (len(self.points) - 2) * 2
-        self.__A = [[0] * self.__dim for d in range(self.__dim)]
-        self.__B = [[0] * self.dimention for d in range(self.__dim)]
         self.__number_of_curves = len(self.points) - 1
-        for points in self.__control_points():
-            self.curves.append(BaseBezier(points=points))
+        self.__state = None
 
-        self.__first_point = self.curves[0].points[0]
-        self.__last_point = self.curves[-1].points[-1]
-        self.__curve_lengths = [curve.get_length() for curve in self.curves]
-        self.__length = sum(self.__curve_lengths)
+        # Already solved segment control points (e.g. from a cache) skip the solve
+        if control_points is not None:
+            if len(control_points) != self.__number_of_curves:
+                raise ValueError(
+                    f'{self.__number_of_curves} segments expected, {len(control_points)} given'
+                )
+            self.__state = SplineState(control_points=control_points)
+
+    @property
+    def state(self) -> SplineState:
+        if self.__state is None:
+            self.__state = SplineState(control_points=self.__control_points())
+        return self.__state
+
+    def invalidate(self):
+        self.__state = None
+
+    @property
+    def curves(self) -> tuple:
+        return self.state.curves
 
     @property
     def first_point(self):
-        return self.__first_point
+        return self.curves[0].points[0]
 
     @property
     def last_point(self):
-        return self.__last_point
+        return self.curves[-1].points[-1]
 
     @property
     def degree(self):
@@ -198,11 +441,12 @@ class BezierThroughPoints(BaseBezier):
 
     @property
     def length(self):
-        return self.__length
+        return self.state.length
 
     @property
     def A(self) -> list:
 
+        self.__A = [[0] * self.__dim for d in range(self.__dim)]
         self.__A[0][:2] = [2, -1]
         self.__A[self.__dim - 1][self.__dim - 2:] = [-1, 2]
 
@@ -218,6 +462,7 @@ class BezierThroughPoints(BaseBezier):
     @property
     def B(self) -> list:
 
+        self.__B = [[0] * self.dimention for d in range(self.__dim)]
         self.__B[0] = self.points[0]
         self.__B[self.__dim - 1] = self.points[len(self.points) - 1]
         self.__B[1:len(self.points) - 1] = [
@@ -232,53 +477,132 @@ class BezierThroughPoints(BaseBezier):
 
     @property
     def lengths(self):
-        return self.__curve_lengths
+        return list(self.state.lengths)
 
-    def get_point(self, point: tuple=([0, 0.0])) -> float:
+    def get_point(self, point: tuple=([0, 0.0]), strict: bool=True) -> float:
 
         idx = self.__get_curve_idx(point=point)
         if idx >= 0:
-            t = self.curves[idx].get_t(point=(point[0], point[1]))
             curve = self.curves[idx]
+            t = curve.solve_t(values=point[1], axis=point[0], strict=strict)
             point = curve.get_point(t=t)
             return (t, point)
         else:
             return -1
 
-    def interpolate(self, points: tuple([0, list])) -> list:
+    def interpolate(self, points: tuple([0, list]), strict: bool=True) -> list:
 
-        curve_indices = [self.__get_curve_idx(point=(points[0], p)) for p in points[1]]
-        out = []
+        axis, values = points
+        curve_indices = self.state.span(axis=axis, values=values).tolist()
+        out = [None] * len(values)
 
-        for i, index in enumerate(curve_indices):
-            if index >= 0:
-                t = self.curves[index].get_t(point=(points[0], points[1][i]))
-                out.append(self.curves[index].get_point(t=t))
+        for index in set(curve_indices) - {-1}:
+            members = [i for i, idx in enumerate(curve_indices) if idx == index]
+            curve = self.curves[index]
+            t = curve.solve_t(values=[values[i] for i in members], axis=axis, strict=strict)
+            for i, point in zip(members, curve.get_points(t)):
+                out[i] = point
 
-        return out
+        return [point for point in out if point is not None]
 
     def norm_length_point(self, norm_length: float=0.0) -> list:
 
-        length = self.length * norm_length
-        idx, ln = self.__get_curve_length_idx(length=length)
-
-        if idx == -1:
+        try:
+            idx, t = self.t_at_length(length=self.length * norm_length)
+        except ValueError:
             return -1
-        else:
-            return self.curves[idx].get_length_point(length=ln)
+        return t, self.curves[idx].get_point(t=t)
+
+    def t_at_length(self, length, tol: float=10**-12, max_iter: int=8) -> tuple:
+        # Spline arc length(s) -> (curve index, curve parameter)
+
+        length = np.asarray(length, dtype=float)
+        s = np.atleast_1d(length)
+        cumulative = self.state.cumulative_lengths
+        eps = 10**-9 * max(self.length, 1.0)
+        if np.any((s < -eps) | (s > cumulative[-1] + eps)):
+            raise ValueError(f'Length is out of the spline length range [0.0, {cumulative[-1]}]')
+
+        idx = np.clip(np.searchsorted(cumulative, s, side='left') - 1, 0, self.num_curves - 1)
+        t = np.zeros(s.shape)
+        for i in np.unique(idx):
+            members = idx == i
+            curve = self.curves[i]
+            local = np.clip(s[members] - cumulative[i], 0.0, curve.arc_length)
+            t[members] = curve.t_at_length(length=local, tol=tol, max_iter=max_iter)
+
+        if length.ndim:
+            return idx, t
+        return int(idx[0]), float(t[0])
+
+    def points_at_normalized_lengths(self, norm_lengths) -> np.ndarray:
+
+        idx, t = self.t_at_length(length=np.asarray(norm_lengths, dtype=float) * self.length)
+        points = np.zeros((len(t), self.dimention))
+        for i in np.unique(idx):
+            members = idx == i
+            points[members] = self.curves[i].evaluate(t[members])
+        return points
+
+    def points_tangents_at_normalized_lengths(self, norm_lengths) -> tuple:
+
+        idx, t = self.t_at_length(length=np.asarray(norm_lengths, dtype=float) * self.length)
+        points = np.zeros((len(t), self.dimention))
+        tangents = np.zeros((len(t), self.dimention))
+        for i in np.unique(idx):
+            members = idx == i
+            curve = self.curves[i]
+            points[members] = curve.evaluate(t[members])
+            tangents[members] = horner(curve.derivative_coefficients, t[members])
+        return points, tangents / np.linalg.norm(tangents, axis=1, keepdims=True)
+
+    def frames(self, norm_lengths, normal: list=None, samples: int=128) -> tuple:
+
+        # Rotation minimizing frames at normalized arc lengths -> (N, 3) arrays
+        # (points, tangents, normals, binormals). normal seeds the frame at the
+        # start of the spline; the double reflection runs over the stations
+        # merged with a uniform grid of samples so sparse stations stay accurate.
+        # Results are cached with the solved state
+        stations = np.asarray(norm_lengths, dtype=float)
+        key = (stations.tobytes(), None if normal is None else tuple(normal), samples)
+        cache = self.state.frames
+        if key in cache:
+            return cache[key]
+
+        grid, inverse = np.unique(
+            np.concatenate((stations, np.linspace(0.0, 1.0, samples))), return_inverse=True
+        )
+        points, tangents = self.points_tangents_at_normalized_lengths(grid)
+        tangents, normals, binormals = rotation_minimizing_frames(
+            points=points, tangents=tangents, normal=normal
+        )
+
+        inverse = inverse.ravel()[:len(stations)]
+        frames = tuple(array[inverse] for array in (points, tangents, normals, binormals))
+        for array in frames:
+            array.flags.writeable = False
+
+        # A few station sets are kept, e.g. while lengths are being edited
+        if len(cache) >= 8:
+            cache.pop(next(iter(cache)))
+        cache[key] = frames
+        return frames
 
     def get_coordinates(self, npoints: int = 0) -> list:
 
         if not npoints:
             npoints = self.num_points
 
+        control_points = self.state.control_points
+        basis = linspace_bernstein_matrix(self.degree, npoints, 1 / npoints, 1 - 1 / npoints)
+        segments = np.einsum('ti,cid->ctd', basis, np.array(control_points, dtype=float))
+
         coordinates = []
 
-        for curve in self.__control_points():
-            coordinates.append(curve[0])
-            for t in linspace(0 + 1 / npoints, 1 - 1 / npoints, npoints):
-                coordinates.append(self._get_coordinates(self.degree, t, curve))
-            
+        for curve, segment in zip(control_points, segments.tolist()):
+            coordinates.append(list(curve[0]))
+            coordinates.extend(segment)
+
         coordinates.append(self.points[-1])
 
         return coordinates
@@ -286,9 +610,10 @@ class BezierThroughPoints(BaseBezier):
     def derivative(self, norm_length: float=0.0) -> list:
         length = norm_length * self.length
         idx, ln = self.__get_curve_length_idx(length=length)
-        point = self.curves[idx].get_length_point(length=ln)
-        t = self.curves[idx].get_t(point=(0, point[1][0]))
-        vector = self.curves[idx].derivative(t=t)
+        # The arc length inverse already gives t; re-solving it from x fails on
+        # segments where x is constant
+        t = self.curves[idx].t_at_length(length=ln)
+        vector = self.curves[idx].derivative(t=float(t))
         norm_vector = normed(vector=vector)
         return norm_vector
 
@@ -302,20 +627,14 @@ class BezierThroughPoints(BaseBezier):
         pass
 
     def __get_curve_length_idx(self, length: float):
-        lengths = [c.get_length() for c in self.curves]
-        l = 0.0
-        for i, ln in enumerate(lengths):
-            l += ln
-            if l >= length:
-                return i, length - sum(lengths[:i])
-
-        return -1, -1
+        cumulative = self.state.cumulative_lengths
+        i = int(np.searchsorted(cumulative[1:], length, side='left'))
+        if i >= self.num_curves:
+            return -1, -1
+        return i, float(length - cumulative[i])
 
     def __get_curve_idx(self, point: tuple):
-        curve_points = [curve.first_point for curve in self.curves]
-        curve_points.append(self.curves[-1].last_point)
-        idx = span(point[1], list(zip(*curve_points))[point[0]])
-        return idx
+        return int(self.state.span(axis=point[0], values=point[1])[0])
 
     def _get_coordinates(self, n, t, points) -> list:
         return super()._get_coordinates(n, t, points)
@@ -328,15 +647,30 @@ class BezierThroughPoints(BaseBezier):
     
     def __control_points(self) -> list:
 
-        cp = matmul(inverse(self.A), self.B)
+        # The system A * cp = B is banded: eliminating the second control point of
+        # every segment through C1 continuity leaves a tridiagonal system for the
+        # first ones, solved for all dimensions at once in linear time
+        p = self.points
+        n = self.num_curves
+
+        if n == 1:
+            first = [[(2 * p0 + p1) / 3 for p0, p1 in zip(p[0], p[1])]]
+            second = [[(p0 + 2 * p1) / 3 for p0, p1 in zip(p[0], p[1])]]
+        else:
+            lower = [0] + [1] * (n - 2) + [2]
+            diagonal = [2] + [4] * (n - 2) + [7]
+            upper = [1] * (n - 1) + [0]
+            rhs = [[p0 + 2 * p1 for p0, p1 in zip(p[0], p[1])]]
+            rhs.extend([4 * pi + 2 * pi1 for pi, pi1 in zip(p[i], p[i + 1])] for i in range(1, n - 1))
+            rhs.append([8 * pi + pn for pi, pn in zip(p[n - 1], p[n])])
+
+            first = solve_tridiagonal(lower=lower, diagonal=diagonal, upper=upper, rhs=rhs)
+            second = [[2 * pi - ci for pi, ci in zip(p[i + 1], first[i + 1])] for i in range(n - 1)]
+            second.append([(pn + ci) / 2 for pn, ci in zip(p[n], first[n - 1])])
+
         control_points = []
 
         for i in range(self.num_curves):
-            tmp = []
-            tmp.append(self.points[i])
-            for p in cp[2 * i:2 * i + 2]:
-                tmp.append(p)
-            tmp.append(self.points[i + 1])
-            control_points.append(tmp)
+            control_points.append([self.points[i], first[i], second[i], self.points[i + 1]])
 
         return control_points
@@ -1,10 +1,52 @@
+import numpy as np
+
 import mathlib.matrix as matrix
 import mathlib.vector as vec
 
 from mathlib.quaternion import Quaternion as Q
 from mathlib.dual_number import DualNumber as DN
 
+
+_BASIS = np.array([[0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]])
+
+
+def quaternion_product(q1, q2) -> np.ndarray:
+    # Hamilton product of (..., 4) arrays laid out as [scalar, i, j, k]
+    q1, q2 = np.asarray(q1, dtype=float), np.asarray(q2, dtype=float)
+    s1, v1 = q1[..., :1], q1[..., 1:]
+    s2, v2 = q2[..., :1], q2[..., 1:]
+    scalar = s1 * s2 - np.sum(v1 * v2, axis=-1, keepdims=True)
+    vector = s1 * v2 + s2 * v1 + np.cross(v1, v2)
+    return np.concatenate((scalar, vector), axis=-1)
+
+
+def quaternion_conjugate(q) -> np.ndarray:
+    return np.asarray(q, dtype=float) * np.array([1.0, -1.0, -1.0, -1.0])
+
+
+def transform_matrices(dual_quaternions) -> np.ndarray:
+    # (..., 8) dual quaternions -> (..., 3, 4) rigid transforms [R | t] of the
+    # sandwich conj(DQ) * (1 + e * p) * DQ used to place points
+    dq = np.asarray(dual_quaternions, dtype=float)
+    real, dual = dq[..., None, :4], dq[..., None, 4:]
+    real_conj, dual_conj = quaternion_conjugate(real), quaternion_conjugate(dual)
+    rotation = quaternion_product(quaternion_product(real_conj, _BASIS), real)[..., 1:]
+    translation = quaternion_product(real_conj, dual) - quaternion_product(dual_conj, real)
+    return np.concatenate((np.swapaxes(rotation, -1, -2), np.swapaxes(translation[..., 1:], -1, -2)), axis=-1)
+
+
+def apply_transforms(transforms, points) -> np.ndarray:
+    # (..., 3, 4) transforms applied to (N, 3) or (..., N, 3) points
+    transforms = np.asarray(transforms, dtype=float)
+    points = np.asarray(points, dtype=float)
+    return points @ np.swapaxes(transforms[..., :3], -1, -2) + transforms[..., None, :, 3]
+
+
 class DualQuaternion:
+
+    # Two slotted quaternions (8 floats) and no per-instance dict
+    __slots__ = ('__D0', '__D1')
+
     def __init__(self, D0: Q=None, 
                        D1: Q=None):
         if not D0:
@@ -76,6 +118,17 @@ class DualQuaternion:
     def dual_quaternion(self):
         return [[q for q in self.__D0.quaternion], [q for q in self.__D1.quaternion]]
 
+    def as_array(self) -> np.ndarray:
+        return np.array([*self.__D0.quaternion, *self.__D1.quaternion], dtype=float)
+
+    def transform_matrix(self) -> np.ndarray:
+        return transform_matrices(self.as_array())
+
+    def transform_points(self, points) -> np.ndarray:
+        # Same result as self.conjugate().mult(PointDQ).mult(self).Dual.vector for
+        # every point, computed as one (N, 3) matrix product
+        return apply_transforms(self.transform_matrix(), points)
+
     def __repr__(self):
         return f'{self.__class__.__name__}\n{self.scalar}' \
                f'Vector:\n{matrix.fprt_mat(m=self.vector, rnd=True, dec=5)}' \
@@ -113,11 +166,49 @@ class DualQuaternion:
                               D1=Q(scalar=0.0, vector=[0.0, 0.0, 0.0]))
 
     def mult(self, DQ: object) -> object:
-        Real = self.Real.mult(DQ.Real)
-        Dual1 = self.Real.mult(DQ.Dual)
-        Dual2 = self.Dual.mult(DQ.Real)
-        Dual = Dual1.addition(Dual2)
-        return DualQuaternion(D0=Real, D1=Dual)
+        real, dual = self.__product(DQ)
+        return DualQuaternion(D0=Q(scalar=real[0], vector=real[1:]), D1=Q(scalar=dual[0], vector=dual[1:]))
+
+    def __product(self, DQ: object) -> tuple:
+        # Fused dual quaternion product: Real = R1 R2, Dual = R1 D2 + D1 R2
+        real = self.__D0.product(DQ.Real)
+        dual1 = self.__D0.product(DQ.Dual)
+        dual2 = self.__D1.product(DQ.Real)
+        return real, [d1 + d2 for d1, d2 in zip(dual1, dual2)]
+
+    def __add__(self, DQ: object) -> object:
+        return self.addition(DQ)
+
+    def __sub__(self, DQ: object) -> object:
+        return self.substraction(DQ)
+
+    def __mul__(self, DQ: object) -> object:
+        if isinstance(DQ, DualQuaternion):
+            return self.mult(DQ)
+        return self.scalar_product(scalar=DQ)
+
+    # In-place operators rebind new quaternions: the current ones may be shared
+    # with other dual quaternions built from the same Quaternion instances
+
+    def __iadd__(self, DQ: object) -> object:
+        self.__D0 = self.__D0.addition(DQ.Real)
+        self.__D1 = self.__D1.addition(DQ.Dual)
+        return self
+
+    def __isub__(self, DQ: object) -> object:
+        self.__D0 = self.__D0.substraction(DQ.Real)
+        self.__D1 = self.__D1.substraction(DQ.Dual)
+        return self
+
+    def __imul__(self, DQ: object) -> object:
+        if isinstance(DQ, DualQuaternion):
+            real, dual = self.__product(DQ)
+            self.__D0 = Q(scalar=real[0], vector=list(real[1:]))
+            self.__D1 = Q(scalar=dual[0], vector=list(dual[1:]))
+        else:
+            self.__D0 = self.__D0.scalar_product(scalar=DQ)
+            self.__D1 = self.__D1.scalar_product(scalar=DQ)
+        return self
 
     def swap(self):
         self.__D0, self.__D1 = self.__D1, self.__D0
@@ -154,3 +245,56 @@ class DualQuaternion:
         D1_derivate = Q.derivate(q=dq.D1, delq=deldq.D1, del_arg=del_arg)
 
         return DualQuaternion(D0=D0_derivate, D1=D1_derivate)
+
+
+class DualQuaternionArray:
+
+    # Array of M dual quaternions stored as an (M, 8) array [D0 | D1]
+
+    def __init__(self, array=None):
+        if array is None:
+            array = np.zeros((0, 8))
+        self.__array = np.array(array, dtype=float).reshape(-1, 8)
+
+    @classmethod
+    def from_dual_quaternions(cls, dual_quaternions: list) -> object:
+        return cls(array=[dq.as_array() for dq in dual_quaternions])
+
+    @property
+    def array(self) -> np.ndarray:
+        return self.__array
+
+    @property
+    def Real(self) -> np.ndarray:
+        return self.__array[:, :4]
+
+    @property
+    def Dual(self) -> np.ndarray:
+        return self.__array[:, 4:]
+
+    def __len__(self):
+        return len(self.__array)
+
+    def __getitem__(self, index: int) -> DualQuaternion:
+        dq = self.__array[index]
+        return DualQuaternion(D0=Q(scalar=dq[0], vector=list(dq[1:4])),
+                              D1=Q(scalar=dq[4], vector=list(dq[5:8])))
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}\n{matrix.fprt_mat(m=self.__array.tolist(), rnd=True, dec=5)}'
+
+    def mult(self, DQ: object) -> object:
+        other = DQ.as_array() if isinstance(DQ, DualQuaternion) else DQ.array
+        real = quaternion_product(self.Real, other[..., :4])
+        dual = quaternion_product(self.Real, other[..., 4:]) + quaternion_product(self.Dual, other[..., :4])
+        return DualQuaternionArray(array=np.concatenate((real, dual), axis=-1))
+
+    def conjugate(self) -> object:
+        return DualQuaternionArray(array=self.__array * np.array([1.0, -1.0, -1.0, -1.0, -1.0, 1.0, 1.0, 1.0]))
+
+    def transform_matrices(self) -> np.ndarray:
+        return transform_matrices(self.__array)
+
+    def transform_points(self, points) -> np.ndarray:
+        # (N, 3) points shared by every frame or (M, N, 3) points per frame -> (M, N, 3)
+        return apply_transforms(self.transform_matrices(), points)
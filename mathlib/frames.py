@@ -0,0 +1,60 @@
+import numpy as np
+
+
+def initial_normal(tangent, normal=None) -> np.ndarray:
+
+    # Unit vector orthogonal to the tangent: the given normal projected onto
+    # the normal plane, or the world axis least aligned with the tangent
+    tangent = np.asarray(tangent, dtype=float)
+    if normal is None:
+        normal = np.eye(3)[np.argmin(np.abs(tangent))]
+    normal = np.asarray(normal, dtype=float)
+    normal = normal - np.dot(normal, tangent) * tangent
+    norm = np.linalg.norm(normal)
+    if norm < 10**-12:
+        raise ValueError('Initial normal is parallel to the tangent')
+    return normal / norm
+
+
+def reflection_maps(points, tangents) -> np.ndarray:
+
+    # (N, 3) points and unit tangents -> (N - 1, 3, 3) orthogonal maps taking the
+    # frame normal of station i to station i + 1 by the double reflection method
+    # (Wang, Juttler, Zheng, Liu 2008). The maps depend on the stations only, so
+    # they are built for all steps at once
+    points = np.asarray(points, dtype=float)
+    tangents = np.asarray(tangents, dtype=float)
+    eye = np.eye(3)
+
+    v1 = points[1:] - points[:-1]
+    c1 = np.sum(v1 * v1, axis=1)
+    c1 = np.where(c1 > 10**-24, c1, np.inf)
+    reflection1 = eye - 2 * v1[:, :, None] * v1[:, None, :] / c1[:, None, None]
+
+    t_left = np.einsum('nij,nj->ni', reflection1, tangents[:-1])
+    v2 = tangents[1:] - t_left
+    c2 = np.sum(v2 * v2, axis=1)
+    c2 = np.where(c2 > 10**-24, c2, np.inf)
+    reflection2 = eye - 2 * v2[:, :, None] * v2[:, None, :] / c2[:, None, None]
+
+    return reflection2 @ reflection1
+
+
+def rotation_minimizing_frames(points, tangents, normal=None) -> tuple:
+
+    # Rotation minimizing frames along sampled stations of a curve:
+    # (N, 3) points and tangents -> unit (tangents, normals, binormals) (N, 3)
+    tangents = np.asarray(tangents, dtype=float)
+    tangents = tangents / np.linalg.norm(tangents, axis=1, keepdims=True)
+
+    maps = reflection_maps(points=points, tangents=tangents)
+    normals = np.zeros(tangents.shape)
+    normals[0] = initial_normal(tangent=tangents[0], normal=normal)
+    for i, step in enumerate(maps):
+        normals[i + 1] = step @ normals[i]
+
+    # Removes the round-off drift from the tangents accumulated over the steps
+    normals -= np.sum(normals * tangents, axis=1, keepdims=True) * tangents
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+
+    return tangents, normals, np.cross(tangents, normals)
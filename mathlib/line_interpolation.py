@@ -1,38 +1,90 @@
+import numpy as np
+
 from mathlib.math import *
 from mathlib.shape import Line
 
 
 class LineInterpolation(Line):
 
+    # Piecewise linear y(x) through points sorted by x. Breakpoints, values and
+    # segment slopes are kept as arrays; queries find their segment with a
+    # binary search and are evaluated all at once. Queries outside [x0, xn]
+    # are handled by mode: 'drop' (skipped), 'clamp' (end values),
+    # 'extrapolate' (end segments extended) or 'raise' (ValueError)
+
+    MODES = ('drop', 'clamp', 'extrapolate', 'raise')
+
     def __init__(self, points: list=[[0.0, 0.0], [1.0, 1.0]]):
         super().__init__(points=points)
         self.__points = points
         self.__num_lines = len(self.__points) - 1
-        self.lines = [
+        self.__lines = None
+
+        table = np.array(points, dtype=float)
+        self.__x = np.ascontiguousarray(table[:, 0])
+        self.__y = np.ascontiguousarray(table[:, 1:])
+        if np.any(np.diff(self.__x) < 0):
+            raise ValueError('Interpolation points must be sorted by abscissa')
+
+        dx = np.diff(self.__x)[:, None]
+        dy = np.diff(self.__y, axis=0)
+        self.__slopes = np.divide(dy, dx, out=np.zeros(dy.shape), where=dx != 0)
+        self.__lengths = np.sqrt(np.sum(np.diff(table, axis=0) ** 2, axis=1)).tolist()
+
+        for array in (self.__x, self.__y, self.__slopes):
+            array.flags.writeable = False
+
+    @property
+    def lines(self):
+        # Line objects are only built when asked for
+        if self.__lines is None:
+            self.__lines = [
                 Line(points=[self.points[i-1], self.points[i]])
                 for i in range(1, self.__num_lines+1)
             ]
-        self.__lengths = [line.get_length() for line in self.lines]
-        
+        return self.__lines
+
     @property
     def num_lines(self):
         return self.__num_lines
-    
+
     @property
     def lengths(self):
         return self.__lengths
 
+    @property
+    def breakpoints(self) -> tuple:
+        return self.__x, self.__y
+
     def get_length(self):
         return sum(self.__lengths)
 
-    def interpolate(self, points: list):
-        out = []
-        for point in points:
-            for line in self.lines:
-                if line.first_point[0] <= point <= line.last_point[0]:
-                    out.append(line.get_point(abscissa=point))
-        return out
-    
+    def evaluate(self, x, mode: str='drop') -> np.ndarray:
+
+        # Query abscissae -> (N, dim) array of [x, y...]; with 'drop' the rows of
+        # out of range queries are removed
+        if mode not in self.MODES:
+            raise ValueError(f'Unknown mode {mode}, one of {self.MODES} expected')
+
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        outside = (x < self.__x[0]) | (x > self.__x[-1])
+        if mode == 'raise' and outside.any():
+            raise ValueError(
+                f'{int(outside.sum())} points are out of the range [{self.__x[0]}, {self.__x[-1]}]'
+            )
+        if mode == 'drop':
+            x = x[~outside]
+
+        # First segment whose end is not before the query, as the segment scan did
+        segment = np.clip(np.searchsorted(self.__x, x, side='left') - 1, 0, self.__num_lines - 1)
+        at = np.clip(x, self.__x[0], self.__x[-1]) if mode == 'clamp' else x
+        values = self.__y[segment] + self.__slopes[segment] * (at - self.__x[segment])[:, None]
+
+        return np.column_stack((x, values))
+
+    def interpolate(self, points: list, mode: str='drop') -> list:
+        return self.evaluate(x=points, mode=mode).tolist()
+
     def __repr__(self):
         lines = ''
         points_str = ''
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def factorial(n: int) -> int:
     if n == 0:
         return 1
@@ -24,3 +27,13 @@ def span(p: float, lst: list) -> int:
             return int(i)
     
     return int(-1)
+
+
+def sorted_span(p, knots) -> np.ndarray:
+
+    # Batched span for non-decreasing knots by binary search: index of the first
+    # interval with knots[i] <= p <= knots[i + 1] for every p, -1 outside
+    knots = np.asarray(knots, dtype=float)
+    p = np.asarray(p, dtype=float)
+    idx = np.clip(np.searchsorted(knots, p, side='left') - 1, 0, max(len(knots) - 2, 0))
+    return np.where((p >= knots[0]) & (p <= knots[-1]), idx, -1)
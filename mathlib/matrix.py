@@ -1,3 +1,37 @@
+import os
+
+import numpy as np
+
+
+# Dense routines run on nested lists ('python') or on numpy arrays with LAPACK
+# ('numpy'); lists are returned either way. Chosen at import by the
+# MATHLIB_MATRIX_BACKEND environment variable, with set_backend or per call
+BACKENDS = ('python', 'numpy')
+
+_backend = os.environ.get('MATHLIB_MATRIX_BACKEND', 'python').lower()
+if _backend not in BACKENDS:
+    raise ValueError(f'Unknown matrix backend {_backend}, one of {BACKENDS} expected')
+
+
+def set_backend(backend: str) -> str:
+    global _backend
+    if backend not in BACKENDS:
+        raise ValueError(f'Unknown matrix backend {backend}, one of {BACKENDS} expected')
+    previous, _backend = _backend, backend
+    return previous
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def _use_numpy(backend: str=None) -> bool:
+    backend = backend or _backend
+    if backend not in BACKENDS:
+        raise ValueError(f'Unknown matrix backend {backend}, one of {BACKENDS} expected')
+    return backend == 'numpy'
+
+
 
 
 def prt_vec (v: list, desc: str='#'*50, dec: int=3) -> None:
@@ -38,7 +72,10 @@ def fprt_mat(m: list, rnd: bool=False, dec: int=5):
     return string
 
 
-def matmul(m1: list, m2: list):
+def matmul(m1: list, m2: list, backend: str=None):
+
+    if _use_numpy(backend):
+        return (np.asarray(m1, dtype=float) @ np.asarray(m2, dtype=float)).tolist()
 
     nrows = len(m1)
     ncols = len(m2[0])
@@ -85,11 +122,18 @@ def scalar_addition(scalar: float, matrix: list) -> list:
     return matrix
 
 
-def transpose(m) -> list:
-    return map(list, zip(*m))
+def transpose(m, backend: str=None) -> list:
+    if _use_numpy(backend):
+        return np.asarray(m, dtype=float).T.tolist()
+    return [list(row) for row in zip(*m)]
+
+
+def separate(m: list, col_num: int, backend: str=None) -> list:
 
+    if _use_numpy(backend):
+        m = np.asarray(m, dtype=float)
+        return [m[:, :col_num].tolist(), m[:, col_num:].tolist()]
 
-def separate(m: list, col_num: int) -> list:
     nrows = len(m)
     cols = len(m[0])
     ncols1 = col_num
@@ -108,6 +152,28 @@ def separate(m: list, col_num: int) -> list:
     return [m1, m2]
 
 
+def solve_tridiagonal(lower: list, diagonal: list, upper: list, rhs: list) -> list:
+
+    # Thomas algorithm for a tridiagonal system, every column of rhs solved at once.
+    # lower[0] and upper[-1] are not used
+    n = len(diagonal)
+    c = [0.0] * n
+    d = [[0.0] * len(rhs[0]) for row in range(n)]
+
+    c[0] = upper[0] / diagonal[0]
+    d[0] = [v / diagonal[0] for v in rhs[0]]
+
+    for i in range(1, n):
+        denominator = diagonal[i] - lower[i] * c[i - 1]
+        c[i] = upper[i] / denominator if i < n - 1 else 0.0
+        d[i] = [(v - lower[i] * prev) / denominator for v, prev in zip(rhs[i], d[i - 1])]
+
+    for i in range(n - 2, -1, -1):
+        d[i] = [v - c[i] * nxt for v, nxt in zip(d[i], d[i + 1])]
+
+    return d
+
+
 def is_square(m) -> bool:
     if not (len(m) == len(m[0])):
         return False
@@ -122,15 +188,11 @@ def swap_row(m: list, i: int, j: int) -> list:
     return m
 
 
-def join(m1, m2) -> list:
-    out = []
-    for row1, row2 in zip(m1, m2):
-        tmp = row1
-        for val in row2:
-            tmp.append(val)
-        out.append(tmp)
-
-    return out
+def join(m1, m2, backend: str=None) -> list:
+    # The rows of m1 are copied, not extended in place
+    if _use_numpy(backend):
+        return np.hstack((np.asarray(m1, dtype=float), np.asarray(m2, dtype=float))).tolist()
+    return [list(row1) + list(row2) for row1, row2 in zip(m1, m2)]
 
 
 def find_row_with_max_element(m, col_num: int=0, starting_row: int=0):
@@ -153,52 +215,76 @@ def identity(ndim: int) -> list:
     return matrix
 
 
-def compare(m1: list, m2: list) -> bool:
-    
-    if not (len(m1) - len(m2)) or not (len(m1[0]) - len(m2[0])):
+def compare(m1: list, m2: list, eps: float=10**-6) -> bool:
+
+    if len(m1) != len(m2) or len(m1[0]) != len(m2[0]):
         return False
-        
+
     for m1_row, m2_row in zip(m1, m2):
         for el_1, el_2 in zip(m1_row, m2_row):
-            if (el_1 - el_2) > 10 ** -6:
+            if abs(el_1 - el_2) > eps:
                 return False
 
     return True
 
 
-def inverse(m) -> list:
+def _eliminate(a: list, b: list) -> list or bool:
+
+    # Gauss-Jordan elimination with partial pivoting of a * x = b, both given as
+    # lists of rows and reduced in place. x or False for a singular matrix
+    n = len(a)
+    for i in range(n):
+        pivot = find_row_with_max_element(a, i, i)
+        if abs(a[pivot][i]) < 10**-14:
+            return False
+        if pivot != i:
+            swap_row(a, i, pivot)
+            swap_row(b, i, pivot)
+
+        factor = 1 / a[i][i]
+        a[i] = [e * factor for e in a[i]]
+        b[i] = [e * factor for e in b[i]]
+        for row in range(n):
+            if row != i and a[row][i] != 0:
+                sub = a[row][i]
+                a[row] = [e1 - sub * e2 for e1, e2 in zip(a[row], a[i])]
+                b[row] = [e1 - sub * e2 for e1, e2 in zip(b[row], b[i])]
+
+    return b
+
+
+def inverse(m, backend: str=None) -> list:
+
+    # Inverse matrix, False if m is not square or singular
     if not is_square(m):
         return False
 
-    identity_matrix = identity(ndim=len(m))
-    num_rows = len(m) - 1
-    joint_matrix = join(m, identity_matrix)
-
-    flag = False
-    count = 0
-    max_count = 100
-
-    while not flag and count < max_count:
-        for i in range(num_rows + 1):
-            if joint_matrix[i][i] == 0.0:
-                max_el_idx = find_row_with_max_element(joint_matrix, i, i)
-                joint_matrix = swap_row(joint_matrix, i, max_el_idx)
-            div_e = joint_matrix[i][i]
-            factor = 1 / div_e
-            joint_matrix[i] = [e * factor for e in joint_matrix[i]]
-            for row in range(0, num_rows+1):
-                if row != i:
-                    if joint_matrix[row][i] != 0:
-                        sub = (-1) * joint_matrix[row][i]
-                        row_add = [el * sub for el in joint_matrix[i]]
-                        joint_matrix[row] = [e1 + e2 for e1, e2 in zip(row_add, joint_matrix[row])]
-    
-        identity_matrix, inverse_matrix = separate(m=joint_matrix, col_num=num_rows+1)
-        if not compare(identity(ndim=num_rows+1), identity_matrix):
-            flag = True
-        count += 1
-    
-    if not flag:
-        return False
-    else:
-        return inverse_matrix
+    if _use_numpy(backend):
+        try:
+            return np.linalg.inv(np.asarray(m, dtype=float)).tolist()
+        except np.linalg.LinAlgError:
+            return False
+
+    return _eliminate(a=[list(row) for row in m], b=identity(ndim=len(m)))
+
+
+def solve(a: list, b: list, backend: str=None) -> list:
+
+    # Solution x of a * x = b with partial pivoting, without forming the inverse.
+    # b is a vector or a matrix of right hand sides (one per column) and x has
+    # the same shape
+    if not is_square(a) or len(a) != len(b):
+        raise ValueError('Shapes of matrices not aligned')
+
+    if _use_numpy(backend):
+        try:
+            return np.linalg.solve(np.asarray(a, dtype=float), np.asarray(b, dtype=float)).tolist()
+        except np.linalg.LinAlgError:
+            raise ValueError('Matrix is singular')
+
+    vector = not isinstance(b[0], (list, tuple))
+    x = _eliminate(a=[list(row) for row in a], b=[[v] if vector else list(v) for v in b])
+    if x is False:
+        raise ValueError('Matrix is singular')
+
+    return [row[0] for row in x] if vector else x
@@ -3,14 +3,18 @@ import mathlib.vector as vec
 
 
 class Quaternion:
+
+    # Slotted 4-float storage: no per-instance dict and no vector list held
+    __slots__ = ('__s', '__x', '__y', '__z')
+
     def __init__(self, scalar: float=0.0, vector: list=[0.0, 0.0, 0.0]):
-        self.__v = [round(vi, 4) for vi in vector]
+        self.__x, self.__y, self.__z = [round(vi, 4) for vi in vector]
         self.__s = round(scalar, 4)
 
 
     @property
     def Im(self):
-        return self.__v
+        return [self.__x, self.__y, self.__z]
 
     @property
     def Re(self):
@@ -22,7 +26,7 @@ class Quaternion:
 
     @property
     def vector(self):
-        return self.__v
+        return [self.__x, self.__y, self.__z]
 
     @property
     def q0(self):
@@ -30,21 +34,21 @@ class Quaternion:
 
     @property
     def q1(self):
-        return self.__v[0]
-    
+        return self.__x
+
     @property
     def q2(self):
-        return self.__v[1]
+        return self.__y
 
     @property
     def q3(self):
-        return self.__v[2]
+        return self.__z
 
     @property
     def quaternion(self):
-        return [self.__s, *self.__v]
+        return [self.__s, self.__x, self.__y, self.__z]
 
-    @scalar.setter 
+    @scalar.setter
     def scalar(self, scalar: float):
         if isinstance(scalar, (float, int)):
             self.__s = scalar
@@ -52,11 +56,11 @@ class Quaternion:
     @vector.setter
     def vector(self, vector: list):
         if hasattr(vector, '__iter__') and all([isinstance(item, (float, int)) for item in vector]):
-            self.__v = vector
+            self.__x, self.__y, self.__z = vector
 
     @property
     def module(self):
-        return round((self.q0 ** 2 + sum(q ** 2 for q in self.vector)) ** 0.5, 4)
+        return round((self.__s ** 2 + self.__x ** 2 + self.__y ** 2 + self.__z ** 2) ** 0.5, 4)
 
     @property
     def norm(self):
@@ -69,31 +73,62 @@ class Quaternion:
                f'+ ({round(self.q2, 5)})j + ({round(self.q3, 7)})k\n' \
                f'Norm:\t{round(self.norm, 7)}\nModule:\t{round(self.module, 7)}'
 
+    def __add__(self, q: object) -> object:
+        return self.addition(q)
+
+    def __sub__(self, q: object) -> object:
+        return self.substraction(q)
+
+    def __mul__(self, q: object) -> object:
+        if isinstance(q, Quaternion):
+            return self.mult(q)
+        return self.scalar_product(scalar=q)
+
+    def __iadd__(self, q: object) -> object:
+        self.__assign(self.__s + q.q0, self.__x + q.q1, self.__y + q.q2, self.__z + q.q3)
+        return self
+
+    def __isub__(self, q: object) -> object:
+        self.__assign(self.__s - q.q0, self.__x - q.q1, self.__y - q.q2, self.__z - q.q3)
+        return self
+
+    def __imul__(self, q: object) -> object:
+        if isinstance(q, Quaternion):
+            self.__assign(*self.product(q))
+        else:
+            self.__assign(self.__s * q, self.__x * q, self.__y * q, self.__z * q)
+        return self
+
+    def __assign(self, s: float, x: float, y: float, z: float):
+        self.__s, self.__x, self.__y, self.__z = round(s, 4), round(x, 4), round(y, 4), round(z, 4)
+
+    def product(self, q: object) -> tuple:
+        # Fused Hamilton product returning the four raw components
+        s0, x0, y0, z0 = self.__s, self.__x, self.__y, self.__z
+        s1, x1, y1, z1 = q.quaternion
+        return (
+            s0 * s1 - x0 * x1 - y0 * y1 - z0 * z1,
+            x0 * s1 + y0 * z1 - z0 * y1 + s0 * x1,
+            -x0 * z1 + y0 * s1 + z0 * x1 + s0 * y1,
+            x0 * y1 - y0 * x1 + z0 * s1 + s0 * z1
+        )
+
     def conjugate(self):
-        return Quaternion(scalar=self.__s, vector=vec.scalar_vector(scalar=-1, vector=self.__v))
+        return Quaternion(scalar=self.__s, vector=[-self.__x, -self.__y, -self.__z])
 
     def inverse(self):
         d = self.norm ** 2
         return Quaternion(scalar=self.scalar / d, vector=vec.scalar_vector(scalar=-1/d, vector=self.vector))
 
     def addition(self, q: object) -> object:
-        sc = self.__s + q.q0
-        vc = vec.addition(v1=self.__v, v2=q.Im)
-        return Quaternion(scalar=sc, vector=vc)
+        return Quaternion(scalar=self.__s + q.q0, vector=[self.__x + q.q1, self.__y + q.q2, self.__z + q.q3])
 
     def substraction(self, q: object) -> object:
-        sc = self.__s - q.q0
-        vc = vec.substraction(v1=self.__v, v2=q.Im)
-        return Quaternion(scalar=sc, vector=vc)
+        return Quaternion(scalar=self.__s - q.q0, vector=[self.__x - q.q1, self.__y - q.q2, self.__z - q.q3])
 
     def mult(self, q: object) -> object:
-        sc = -self.q1 * q.q1 - self.q2 * q.q2 - self.q3 * q.q3 + self.q0 * q.q0
-        vc = [
-            self.q1 * q.q0 + self.q2 * q.q3 - self.q3 * q.q2 + self.q0 * q.q1,
-            -self.q1 * q.q3 + self.q2 * q.q0 + self.q3 * q.q1 + self.q0 * q.q2,
-            self.q1 * q.q2 - self.q2 * q.q1 + self.q3 * q.q0 + self.q0 * q.q3
-        ]
-        return Quaternion(scalar=sc, vector=vc)
+        s, x, y, z = self.product(q)
+        return Quaternion(scalar=s, vector=[x, y, z])
 
     def dot(self, q: object) -> object:
         return Quaternion(scalar=vec.dot(v1=self.vector, v2=q.vector), vector=[0]*3)
@@ -107,11 +142,11 @@ class Quaternion:
 
     def normed(self):
         d = self.norm
-        self.__v = vec.scalar_vector(scalar=1/d, vector=self.vector)
-        self.__s = self.__s / d 
+        self.__x, self.__y, self.__z = self.__x / d, self.__y / d, self.__z / d
+        self.__s = self.__s / d
 
     def scalar_product(self, scalar: float) -> object:
-        return Quaternion(scalar=self.scalar*scalar, vector=vec.scalar_vector(scalar=scalar, vector=self.vector))
+        return Quaternion(scalar=self.__s * scalar, vector=[self.__x * scalar, self.__y * scalar, self.__z * scalar])
 
     @staticmethod
     def derivate(q: object, delq: object, del_arg: float) -> object:
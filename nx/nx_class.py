@@ -812,10 +812,10 @@ class NX:
                         points = arc
                         pt = [p * self.units for p in points[0]]
                         statr_pt = Nx.Point3d(*pt)
-                        pt = [p * self.units for p in points[1]]
+                        pt = [p * self.units for p in points[len(points) // 2]]
                         help_point = pt
                         point_on = Nx.Point3d(*pt)
-                        pt = [p * self.units for p in points[2]]
+                        pt = [p * self.units for p in points[-1]]
                         end_point = Nx.Point3d(*pt)
                         nx_arc = work_part.Curves.CreateArc(statr_pt, point_on, end_point, False)
                         obj_tag = nx_arc[0].Tag
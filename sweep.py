@@ -0,0 +1,58 @@
+import sys
+import json
+import argparse
+import logging
+
+from diffuser.sweep import parameter_grid, check_overrides, run_sweep
+from utils.cache import InputCache, ResultCache
+
+
+def build_parser() -> argparse.ArgumentParser:
+
+    parser = argparse.ArgumentParser(
+        description='Parametric sweep of pipe diffuser geometry over a p1112 file'
+    )
+    parser.add_argument('indata', help='base p1112 input file')
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('--grid', help='JSON file: {"parameter": [values, ...], ...}')
+    group.add_argument('--variants', help='JSON file: [{"parameter": value, ...}, ...]')
+    parser.add_argument('-n', '--num-sec', type=int, default=25, help='number of cross sections')
+    parser.add_argument('-o', '--outdir', default='sweep', help='output directory')
+    parser.add_argument('--cache', default='', help='directory of the parsed input cache, off if not set')
+    parser.add_argument('--result-cache', default='',
+                        help='directory of the cross sections cache, off if not set')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='worker processes')
+
+    return parser
+
+
+def parse_args(argv: list=None):
+    return build_parser().parse_args(argv)
+
+
+if __name__ == "__main__":
+
+    parser = build_parser()
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    with open(args.grid or args.variants, 'r') as fi:
+        spec = json.load(fi)
+
+    # A malformed spec or an unknown parameter is a usage error
+    try:
+        variants = parameter_grid(**spec) if args.grid else spec
+        for overrides in variants:
+            check_overrides(overrides)
+    except (ValueError, TypeError) as ex:
+        parser.error(f'{args.grid or args.variants}: {ex}')
+    records = run_sweep(
+        indata_file=args.indata, variants=variants, num_sec=args.num_sec,
+        outdir=args.outdir, workers=args.workers,
+        cache=InputCache(cache_dir=args.cache) if args.cache else None,
+        result_cache=ResultCache(cache_dir=args.result_cache) if args.result_cache else None
+    )
+
+    failed = sum(1 for record in records if record['error'])
+    logging.info(f'{len(records) - failed} of {len(records)} variants written to {args.outdir}')
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,23 @@
+import os
+import math
+
+import pytest
+
+
+INDATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'indata')
+INDATA_FILES = sorted(
+    os.path.join(INDATA_DIR, f) for f in os.listdir(INDATA_DIR) if f.endswith('.p1112')
+)
+
+
+def curve_points(num_points: int) -> list:
+    # Smooth x-monotone curve like the x-r / x-beta distributions
+    return [
+        [i / (num_points - 1), 0.5 + 0.3 * math.sin(3 * i / (num_points - 1))]
+        for i in range(num_points)
+    ]
+
+
+@pytest.fixture(params=INDATA_FILES, ids=os.path.basename)
+def indata_file(request) -> str:
+    return request.param
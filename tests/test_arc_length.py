@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from mathlib.bezier import BaseBezier, BezierThroughPoints
+
+from conftest import curve_points
+
+
+CURVE = [[0.0, 0.0], [0.3, 0.8], [0.7, 0.9], [1.0, 0.2]]
+
+
+def test_line_length():
+    line = BaseBezier(points=[[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [3.0, 3.0]])
+    assert line.arc_length == pytest.approx(3 * 2 ** 0.5, rel=10**-10)
+
+
+def test_t_at_length_round_trip():
+    curve = BaseBezier(points=CURVE)
+    t = np.linspace(0.0, 1.0, 41)
+    lengths = curve.get_lengths(t1=np.zeros(t.shape), t2=t, tol=10**-12)
+    assert np.allclose(curve.t_at_length(length=lengths), t, atol=10**-9)
+
+
+def test_get_length_point_is_on_the_curve():
+    curve = BaseBezier(points=CURVE)
+    t, point = curve.get_length_point(length=curve.arc_length / 3)
+    assert curve.get_length(t1=0.0, t2=t, tol=10**-12) == pytest.approx(curve.arc_length / 3, abs=10**-9)
+    assert np.allclose(point, curve.get_point(t=t))
+
+
+def test_spline_t_at_length_round_trip():
+    spline = BezierThroughPoints(points=curve_points(15), npoints=2)
+    cumulative = spline.state.cumulative_lengths
+    assert cumulative[-1] == pytest.approx(sum(spline.lengths))
+
+    lengths = np.linspace(0.0, spline.length, 57)
+    idx, t = spline.t_at_length(length=lengths)
+    measured = [
+        cumulative[i] + spline.curves[i].get_length(t1=0.0, t2=ti, tol=10**-12) for i, ti in zip(idx, t)
+    ]
+    assert np.allclose(measured, lengths, atol=10**-9)
+
+
+def test_spline_length_out_of_range():
+    spline = BezierThroughPoints(points=curve_points(5), npoints=2)
+    with pytest.raises(ValueError):
+        spline.t_at_length(length=spline.length * 1.01)
+
+
+def test_normalized_length_points_are_evenly_spaced():
+    spline = BezierThroughPoints(points=curve_points(8), npoints=2)
+    points = spline.points_at_normalized_lengths(np.linspace(0.0, 1.0, 201))
+    chords = np.linalg.norm(np.diff(points, axis=0), axis=1)
+    assert np.allclose(chords, spline.length / 200, rtol=10**-3)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from mathlib.bezier import BaseBezier, BezierThroughPoints
+
+from conftest import curve_points
+
+
+MONOTONE = [[0.0, 0.0], [0.3, 0.8], [0.7, 0.9], [1.0, 0.2]]
+# x runs forward, back and forward again
+NON_MONOTONE = [[0.0, 0.0], [1.0, 1.0], [-0.2, 2.0], [1.0, 3.0]]
+
+
+def test_solve_t_round_trip():
+    curve = BaseBezier(points=MONOTONE)
+    t = np.linspace(0.0, 1.0, 101)
+    x = curve.evaluate(t)[:, 0]
+    assert np.allclose(curve.solve_t(values=x, axis=0), t, atol=10**-9)
+
+
+def test_solve_t_scalar_and_decreasing_axis():
+    curve = BaseBezier(points=[[0.0, 1.0], [0.2, 0.7], [0.6, 0.4], [1.0, 0.0]])
+    t = curve.solve_t(values=0.55, axis=1)
+    assert isinstance(t, float)
+    assert curve.get_point(t=t)[1] == pytest.approx(0.55, abs=10**-10)
+
+
+def test_solve_t_out_of_range():
+    with pytest.raises(ValueError):
+        BaseBezier(points=MONOTONE).solve_t(values=1.5, axis=0)
+
+
+def test_solve_t_strict_by_default():
+    curve = BaseBezier(points=NON_MONOTONE)
+    assert not curve.is_monotone(axis=0)
+    with pytest.raises(ValueError):
+        curve.solve_t(values=0.4, axis=0)
+    with pytest.raises(ValueError):
+        curve.get_t(point=(0, 0.4))
+
+
+def test_solve_t_lenient_takes_first_monotone_piece():
+    curve = BaseBezier(points=NON_MONOTONE)
+    knots = curve.monotone_knots(axis=0)
+    assert len(knots) == 4
+
+    values = np.linspace(0.05, 0.43, 9)
+    t = curve.solve_t(values=values, axis=0, strict=False)
+    assert np.allclose(curve.evaluate(t)[:, 0], values, atol=10**-9)
+    assert np.all(t <= knots[1])
+
+
+def test_spline_interpolate_round_trip():
+    points = curve_points(12)
+    spline = BezierThroughPoints(points=points, npoints=2)
+    x = np.linspace(0.0, 1.0, 37).tolist()
+    out = spline.interpolate(points=(0, x))
+    assert np.allclose([p[0] for p in out], x, atol=10**-9)
+    # The knots are passed through
+    knots = spline.interpolate(points=(0, [p[0] for p in points]))
+    assert np.allclose(knots, points, atol=10**-9)
@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+import pytest
+
+from diffuser import pipeline
+
+from conftest import INDATA_DIR
+
+
+NUM_SEC = 10
+ORIGINAL = os.path.join(INDATA_DIR, 'diffuser7-original.p1112')
+
+
+def computed(data: dict) -> dict:
+    result = pipeline.compute_mean_line(data=data, num_sec=NUM_SEC)
+    return pipeline.compute_cross_sections(data=data, result=result)
+
+
+@pytest.fixture
+def data():
+    return pipeline.parse_p1112(indata_file=ORIGINAL)
+
+
+def test_unchanged_inputs_keep_results(data):
+    diffuser = computed(data)['diffuser']
+    assert not diffuser.dirty
+    sections = diffuser.compute_cross_sections()
+
+    diffuser.twist = diffuser.twist
+    diffuser.wh = diffuser.wh
+    diffuser.lengths = diffuser.lengths
+    diffuser.rexit = diffuser.rexit
+    assert not diffuser.dirty
+    assert diffuser.compute_cross_sections() is sections
+
+
+def test_getter_returns_a_copy(data):
+    diffuser = computed(data)['diffuser']
+    twist = diffuser.twist
+    twist[0][1] += 10.0
+    assert not diffuser.dirty
+    assert diffuser.twist[0][1] == twist[0][1] - 10.0
+
+
+@pytest.mark.parametrize('name, stage', [('twist', 'sections'), ('wh', 'shapes'), ('area', 'shapes')])
+def test_edit_matches_fresh_compute(data, name, stage):
+    diffuser = computed(data)['diffuser']
+
+    points = getattr(diffuser, name)
+    points[NUM_SEC // 2][1] *= 1.1
+    setattr(diffuser, name, points)
+    assert stage in diffuser.dirty and 'sections' in diffuser.dirty
+    assert 'mean_line' not in diffuser.dirty
+    sections = diffuser.compute_cross_sections()
+
+    fresh = pipeline.compute_mean_line(data=data, num_sec=NUM_SEC)['diffuser']
+    fresh.lengths = diffuser.lengths
+    fresh.wh = diffuser.wh
+    fresh.area = diffuser.area
+    fresh.twist = diffuser.twist
+    assert np.allclose(
+        [section[1] for section in sections],
+        [section[1] for section in fresh.compute_cross_sections()],
+        atol=10**-12
+    )
+
+
+def test_exit_case_edit_matches_fresh_compute(data):
+    diffuser = computed(data)['diffuser']
+    diffuser.rexit = diffuser.rexit + 0.5
+    assert 'shapes' in diffuser.dirty
+    sections = diffuser.compute_cross_sections()
+
+    data['indata']['r_exit_case'] += 0.5
+    fresh = computed(data)['cross_sections']
+    assert np.allclose([section[1] for section in sections], [section[1] for section in fresh], atol=10**-12)
+
+
+def test_mismatched_stations(data):
+    diffuser = computed(data)['diffuser']
+    diffuser.twist = diffuser.twist[:-1]
+    with pytest.raises(ValueError, match='twist values expected'):
+        diffuser.compute_cross_sections()
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from mathlib.line_interpolation import LineInterpolation
+
+
+POINTS = [[0.0, 1.0], [0.5, 2.0], [1.0, 0.0], [2.0, 0.5]]
+
+
+def reference(points: list, x: float) -> list or None:
+    # Segment scan of the original implementation, first matching segment only
+    for (x0, y0), (x1, y1) in zip(points[:-1], points[1:]):
+        if x0 <= x <= x1:
+            return [x, y0 if x1 == x0 else y0 + (y1 - y0) * (x - x0) / (x1 - x0)]
+    return None
+
+
+def test_matches_segment_scan():
+    queries = np.linspace(0.0, 2.0, 81).tolist()
+    expected = [reference(POINTS, x) for x in queries]
+    assert np.allclose(LineInterpolation(points=POINTS).interpolate(points=queries), expected)
+
+
+def test_breakpoint_gives_one_value():
+    line = LineInterpolation(points=POINTS)
+    assert line.interpolate(points=[0.5, 1.0]) == [[0.5, 2.0], [1.0, 0.0]]
+
+
+def test_repeated_abscissa():
+    points = [[0.0, 0.0], [1.0, 1.0], [1.0, 3.0], [2.0, 4.0]]
+    queries = [0.5, 1.0, 1.5]
+    assert LineInterpolation(points=points).interpolate(points=queries) == [reference(points, x) for x in queries]
+
+
+def test_modes():
+    line = LineInterpolation(points=POINTS)
+    queries = [-1.0, 0.25, 3.0]
+
+    assert line.interpolate(points=queries) == [[0.25, 1.5]]
+    assert line.interpolate(points=queries, mode='drop') == [[0.25, 1.5]]
+    assert line.interpolate(points=queries, mode='clamp') == [[-1.0, 1.0], [0.25, 1.5], [3.0, 0.5]]
+    assert np.allclose(line.interpolate(points=queries, mode='extrapolate'), [[-1.0, -1.0], [0.25, 1.5], [3.0, 1.0]])
+    with pytest.raises(ValueError, match='2 points are out of the range'):
+        line.interpolate(points=queries, mode='raise')
+    with pytest.raises(ValueError, match='Unknown mode'):
+        line.interpolate(points=queries, mode='nearest')
+
+
+def test_several_ordinates():
+    line = LineInterpolation(points=[[0.0, 0.0, 10.0], [1.0, 2.0, 20.0]])
+    assert line.evaluate(x=0.5).tolist() == [[0.5, 1.0, 15.0]]
+
+
+def test_unsorted_abscissae():
+    with pytest.raises(ValueError, match='sorted by abscissa'):
+        LineInterpolation(points=[[0.0, 0.0], [1.0, 1.0], [0.5, 2.0]])
+
+
+def test_lines_are_built_on_demand():
+    line = LineInterpolation(points=POINTS)
+    assert line.num_lines == len(line.lines) == 3
+    assert line.get_length() == pytest.approx(sum(l.get_length() for l in line.lines))
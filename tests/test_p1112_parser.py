@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from utils.p1112_parser import P1112, read_p1112, distribution, input_parameters_p1112
+from utils.p1112_parser import INPUT_PARAMETERS_KEYS
+
+from conftest import INDATA_DIR
+
+
+ORIGINAL = os.path.join(INDATA_DIR, 'diffuser7-original.p1112')
+
+
+def reference_distribution(in_file: str, header: str) -> list:
+    # Line by line lookup of a section, as the parser did before indexing
+    with open(in_file, 'r') as fi:
+        lines = fi.read().splitlines()
+    i = [line.lower().strip() for line in lines].index(header)
+    num_of_points = int(lines[i + 1])
+    return [[float(v) for v in line.split()] for line in lines[i + 2:i + 2 + num_of_points]]
+
+
+def test_input_parameters():
+    record = read_p1112(ORIGINAL)
+    parameters = record.input_parameters
+    assert list(parameters) == INPUT_PARAMETERS_KEYS
+    assert parameters['num_pipes'] == 22.0
+    assert parameters['beta_init'] == 51.0
+    assert parameters['ml_cross_section_curve'] == 0.3
+
+
+def test_index():
+    record = read_p1112(ORIGINAL)
+    assert record.headers[:3] == ['limits (gas generator)', 'input parameters', 'x-r curve']
+    assert record.index['input parameters'] == (5, 9)
+    assert record.distribution(string='x-r curve')[0] == [0.0, 8.2043]
+
+
+def test_distributions_match_reference(indata_file):
+    record = P1112(in_file=indata_file)
+    distributions = record.distributions
+    assert distributions
+    for header, points in distributions.items():
+        assert points == reference_distribution(indata_file, header)
+
+
+def test_text_and_file_agree(indata_file):
+    with open(indata_file, 'r') as fi:
+        text = fi.read()
+    from_text = P1112(text=text)
+    from_file = P1112(in_file=indata_file)
+    assert from_text.index == from_file.index
+    assert from_text.distributions == from_file.distributions
+    assert from_text.input_parameters == from_file.input_parameters
+
+
+def test_missing_section():
+    record = read_p1112(ORIGINAL)
+    with pytest.raises(ValueError):
+        record.distribution(string='no such curve')
+
+
+def test_truncated_distribution():
+    record = P1112(text=' X-R CURVE\n 3\n 0.0 1.0\n 1.0 2.0\n')
+    with pytest.raises(ValueError, match='3 points expected, 2 found'):
+        record.distribution(string='x-r curve')
+
+
+def test_short_input_parameters():
+    record = P1112(text=' INPUT PARAMETERS\n 22.0 0.684 7.4\n')
+    with pytest.raises(ValueError, match='input parameters expected'):
+        record.input_parameters
+
+
+def test_legacy_wrappers():
+    in_file = ORIGINAL
+    points, found = distribution(in_file=in_file, string='x-r curve')
+    assert found and points[0] == [0.0, 8.2043]
+    error, found = distribution(in_file=in_file, string='no such curve')
+    assert not found and isinstance(error, ValueError)
+    parameters, found = input_parameters_p1112(in_file=in_file)
+    assert found and parameters['num_pipes'] == 22.0
@@ -0,0 +1,69 @@
+import os
+import math
+import shutil
+
+import pytest
+
+from utils.p1112_parser import P1112, scan_p1112, iter_p1112, iter_distributions
+from utils.p1112_parser import HEADER_PATTERN, FIRST_HEADER_PATTERN, is_header
+
+
+def read_bytes(in_file: str) -> bytes:
+    with open(in_file, 'rb') as fi:
+        return fi.read()
+
+
+def assert_same_record(streamed: P1112, text: P1112):
+    assert streamed.index == text.index
+    assert streamed.distributions == text.distributions
+    assert streamed.input_parameters == text.input_parameters
+
+
+def test_scan_matches_text_reader(indata_file):
+    buffer = read_bytes(indata_file)
+    records = list(scan_p1112(buffer=buffer))
+    assert len(records) == 1
+    assert_same_record(records[0], P1112(text=buffer.decode('latin-1')))
+
+
+def test_concatenated_archive(indata_file):
+    buffer = read_bytes(indata_file)
+    records = list(scan_p1112(buffer=buffer + buffer))
+    assert len(records) == 2
+    for record in records:
+        assert_same_record(record, P1112(text=buffer.decode('latin-1')))
+
+
+def test_data_lines_that_look_like_words():
+    text = ' X-R CURVE\n 2\nnan 1.0\n 1.0 2.0\n 3D SECTION\n 1\n 0.5 0.5\n'
+    streamed, = scan_p1112(buffer=text.encode())
+    assert streamed.index == P1112(text=text).index == {'x-r curve': (1, 4), '3d section': (5, 7)}
+    points = streamed.distribution(string='x-r curve')
+    assert math.isnan(points[0][0]) and points[1:] == [[1.0, 2.0]]
+    assert streamed.distribution(string='3d section') == [[0.5, 0.5]]
+
+
+@pytest.mark.parametrize('line', [
+    'X-R CURVE', '  area distribution', '3D SECTION', 'inflow', '1.0.0', '-', '+x',
+    '0.5 1.0', '  -1.5E-03 2', '.5', '1_000 2', 'nan 1', '-inf', 'Infinity', '1e5', '', '   ',
+])
+def test_header_pattern_matches_is_header(line):
+    assert bool(FIRST_HEADER_PATTERN.fullmatch(line.encode())) == is_header(line)
+    assert bool(HEADER_PATTERN.fullmatch(b'\n' + line.encode())) == is_header(line)
+
+
+def test_iter_file_and_directory(tmp_path, indata_file):
+    buffer = read_bytes(indata_file)
+    archive = tmp_path / 'archive.p1112'
+    archive.write_bytes(buffer + buffer)
+    shutil.copy(indata_file, tmp_path / os.path.basename(indata_file))
+    (tmp_path / 'empty.p1112').write_bytes(b'')
+    (tmp_path / 'notes.txt').write_bytes(buffer)
+
+    assert len(list(iter_p1112(path=str(archive)))) == 2
+    records = list(iter_p1112(path=str(tmp_path)))
+    assert len(records) == 3
+    assert {os.path.basename(r.file) for r in records} == {'archive.p1112', os.path.basename(indata_file)}
+
+    found = [ok for _, _, ok in iter_distributions(path=str(tmp_path), string='x-r curve')]
+    assert found == [True] * 3
@@ -0,0 +1,68 @@
+import os
+
+import numpy as np
+import pytest
+
+from diffuser import pipeline
+from utils.cache import ResultCache
+
+from conftest import INDATA_DIR
+
+
+NUM_SEC = 10
+ORIGINAL = os.path.join(INDATA_DIR, 'diffuser7-original.p1112')
+
+
+def cross_sections(data: dict, cache: ResultCache=None, overrides: dict=None) -> list:
+    result = pipeline.compute_mean_line(data=data, num_sec=NUM_SEC, overrides=overrides)
+    result = pipeline.compute_cross_sections(data=data, result=result, cache=cache)
+    return result['cross_sections']
+
+
+@pytest.fixture
+def data():
+    return pipeline.parse_p1112(indata_file=ORIGINAL)
+
+
+def test_miss_then_hit(tmp_path, data):
+    cache = ResultCache(cache_dir=str(tmp_path))
+    uncached = cross_sections(data=data)
+
+    first = cross_sections(data=data, cache=cache)
+    assert cache.stats == {'hits': 0, 'misses': 1}
+    second = cross_sections(data=data, cache=cache)
+    assert cache.stats == {'hits': 1, 'misses': 1}
+
+    assert first == uncached
+    assert second == uncached
+
+
+def test_changed_inputs_miss(tmp_path, data):
+    cache = ResultCache(cache_dir=str(tmp_path))
+    cross_sections(data=data, cache=cache)
+
+    data['twist'] = [[length, twist + 1.0] for length, twist in data['twist']]
+    cross_sections(data=data, cache=cache)
+    cross_sections(data=data, cache=cache, overrides={'arc_points': 7})
+    assert cache.stats == {'hits': 0, 'misses': 3}
+    assert len(os.listdir(tmp_path)) == 3
+
+
+def test_key_is_canonical(tmp_path):
+    cache = ResultCache(cache_dir=str(tmp_path))
+    points = [[0.0, 1.0], [2.0, 3.0]]
+    assert cache.key(twist=points, arc_points=101) == cache.key(arc_points=101.0, twist=np.array(points))
+    assert cache.key(twist=points, arc_points=101) != cache.key(twist=points, arc_points=7)
+    assert cache.key(twist=points) != cache.key(twist=[0.0, 1.0, 2.0, 3.0])
+
+
+def test_corrupt_entry_is_a_miss(tmp_path, data):
+    cache = ResultCache(cache_dir=str(tmp_path))
+    expected = cross_sections(data=data, cache=cache)
+    entry, = tmp_path.iterdir()
+    entry.write_bytes(b'not an npz file')
+
+    assert cross_sections(data=data, cache=cache) == expected
+    assert cache.stats == {'hits': 0, 'misses': 2}
+    assert cross_sections(data=data, cache=cache) == expected
+    assert cache.stats['hits'] == 1
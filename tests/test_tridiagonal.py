@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from mathlib.bezier import BezierThroughPoints
+from mathlib.matrix import solve_tridiagonal
+
+from conftest import curve_points
+
+
+@pytest.mark.parametrize('num_points', [2, 3, 10, 100])
+def test_control_points_match_dense_solve(num_points):
+    spline = BezierThroughPoints(points=curve_points(num_points), npoints=2)
+    dense = np.linalg.solve(np.array(spline.A, dtype=float), np.array(spline.B, dtype=float))
+
+    expected = [
+        [spline.points[i], dense[2 * i], dense[2 * i + 1], spline.points[i + 1]] for i in range(spline.num_curves)
+    ]
+    assert np.allclose(np.array(spline.state.control_points), np.array(expected, dtype=float), atol=10**-9)
+
+
+def test_solve_tridiagonal_matches_dense_solve():
+    rng = np.random.default_rng(3)
+    n = 12
+    lower = [0.0] + list(rng.uniform(0.5, 1.0, n - 1))
+    upper = list(rng.uniform(0.5, 1.0, n - 1)) + [0.0]
+    diagonal = list(rng.uniform(3.0, 4.0, n))
+    rhs = rng.uniform(-1.0, 1.0, (n, 3)).tolist()
+
+    dense = np.diag(diagonal) + np.diag(lower[1:], -1) + np.diag(upper[:-1], 1)
+    solution = solve_tridiagonal(lower=lower, diagonal=diagonal, upper=upper, rhs=rhs)
+    assert np.allclose(solution, np.linalg.solve(dense, rhs), atol=10**-12)
+
+
+def test_spline_is_c2_at_the_knots():
+    spline = BezierThroughPoints(points=curve_points(10), npoints=2)
+    cp = np.array(spline.state.control_points, dtype=float)
+    # first and second derivative continuity between consecutive segments
+    assert np.allclose(cp[:-1, 3] - cp[:-1, 2], cp[1:, 1] - cp[1:, 0], atol=10**-9)
+    assert np.allclose(cp[:-1, 1] - 2 * cp[:-1, 2] + cp[:-1, 3], cp[1:, 0] - 2 * cp[1:, 1] + cp[1:, 2], atol=10**-9)
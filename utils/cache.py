@@ -0,0 +1,196 @@
+import os
+import io
+import hashlib
+import logging
+
+import numpy as np
+
+
+# Bumped whenever the stored layout changes so old entries are never read back
+CACHE_VERSION = b'p1112-cache-1'
+RESULT_CACHE_VERSION = b'cross-sections-cache-2'
+
+DISTRIBUTION_KEYS = ('xr', 'xbeta', 'wh', 'area', 'twist')
+SPLINE_KEYS = ('xr', 'xbeta')
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(in_file: str) -> str:
+
+    digest = hashlib.sha256(CACHE_VERSION)
+    with open(in_file, 'rb') as fi:
+        for chunk in iter(lambda: fi.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskCache:
+
+    # Directory of .npz entries named by a content hash; once the directory
+    # grows over max_bytes entries are evicted least recently used first
+
+    def __init__(self, cache_dir: str, max_bytes: int=64 * 2 ** 20):
+        self.__cache_dir = cache_dir
+        self.__max_bytes = max_bytes
+        self.__hits = 0
+        self.__misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def cache_dir(self) -> str:
+        return self.__cache_dir
+
+    @property
+    def max_bytes(self) -> int:
+        return self.__max_bytes
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    @property
+    def stats(self) -> dict:
+        return {'hits': self.__hits, 'misses': self.__misses}
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.__cache_dir, f'{key}.npz')
+
+    def read(self, key: str) -> dict or None:
+
+        entry = self.path(key)
+        try:
+            with np.load(entry, allow_pickle=False) as npz:
+                arrays = {name: npz[name] for name in npz.files}
+        except (OSError, KeyError, ValueError) as ex:
+            if os.path.exists(entry):
+                logger.warning(f'Cache entry {entry} is unreadable and will be replaced: {ex}')
+            self.__misses += 1
+            return None
+
+        # Touching the entry marks it as recently used for eviction
+        try:
+            os.utime(entry)
+        except FileNotFoundError:
+            pass
+        self.__hits += 1
+        return arrays
+
+    def write(self, key: str, arrays: dict) -> str:
+
+        # Written to a temporary file and moved in place so concurrent readers
+        # never see a partial entry
+        entry = self.path(key)
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+        tmp_file = f'{entry}.{os.getpid()}.tmp'
+        with open(tmp_file, 'wb') as fo:
+            fo.write(buffer.getvalue())
+        os.replace(tmp_file, entry)
+
+        self.evict()
+        return entry
+
+    def evict(self) -> list:
+
+        entries = []
+        for name in os.listdir(self.__cache_dir):
+            if name.endswith('.npz'):
+                try:
+                    stat = os.stat(os.path.join(self.__cache_dir, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        removed = []
+        total = sum(entry[1] for entry in entries)
+        for mtime, size, name in sorted(entries):
+            if total <= self.__max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.__cache_dir, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed.append(name)
+
+        return removed
+
+    def clear(self):
+        for name in os.listdir(self.__cache_dir):
+            if name.endswith('.npz'):
+                os.remove(os.path.join(self.__cache_dir, name))
+
+
+class InputCache(DiskCache):
+
+    # Parsed p1112 data (input parameters, distributions) and optionally the
+    # solved x-r / x-beta spline control points, keyed by the sha256 of the
+    # p1112 file contents
+
+    def load(self, in_file: str) -> dict or None:
+
+        arrays = self.read(key=content_hash(in_file))
+        if arrays is None:
+            return None
+
+        try:
+            data = {'indata': dict(zip(arrays['indata_keys'].tolist(), arrays['indata_values'].tolist()))}
+            for name in DISTRIBUTION_KEYS:
+                data[name] = arrays[name].tolist()
+        except KeyError:
+            return None
+
+        splines = {
+            name: arrays[f'spline_{name}'].tolist() for name in SPLINE_KEYS
+            if f'spline_{name}' in arrays
+        }
+        if splines:
+            data['splines'] = splines
+
+        return data
+
+    def store(self, in_file: str, data: dict, splines: dict=None) -> str:
+
+        arrays = {
+            'indata_keys': np.array(list(data['indata'].keys())),
+            'indata_values': np.array(list(data['indata'].values()), dtype=float)
+        }
+        for name in DISTRIBUTION_KEYS:
+            arrays[name] = np.array(data[name], dtype=float)
+        for name, control_points in (splines or {}).items():
+            arrays[f'spline_{name}'] = np.array(control_points, dtype=float)
+
+        return self.write(key=content_hash(in_file), arrays=arrays)
+
+
+class ResultCache(DiskCache):
+
+    # Cross sections of a PipeDiffuser keyed by a canonical hash of everything
+    # compute_cross_sections depends on
+
+    def key(self, **inputs) -> str:
+
+        # Inputs are hashed in name order as float64 bytes together with their
+        # shapes, so equal geometry gives equal keys whatever the container type
+        digest = hashlib.sha256(RESULT_CACHE_VERSION)
+        for name in sorted(inputs):
+            value = np.ascontiguousarray(inputs[name], dtype=float)
+            digest.update(name.encode())
+            digest.update(repr(value.shape).encode())
+            digest.update(value.tobytes())
+        return digest.hexdigest()
+
+    def load(self, key: str) -> list or None:
+
+        arrays = self.read(key=key)
+        if arrays is None or 'sections' not in arrays:
+            return None
+        return arrays['sections'].tolist()
+
+    def store(self, key: str, sections: list) -> str:
+        return self.write(key=key, arrays={'sections': np.array(sections, dtype=float)})
@@ -1,51 +1,236 @@
+import os
+import re
+import mmap
 import itertools
-from utils.utils import Utils
 
+from typing import Iterator
 
-def input_parameters_p1112(in_file: str) -> dict:
-    
-    foperate = Utils(in_file=in_file)
 
-    input_parameter_values = []
-    input_parameters_keys = [
-        'num_pipes', 'diam_1st_sec', 'imp_tan_rad', 'tot_area_ratio',
-        'len_star', 'del_len_star', 'radial_gap', 'cross_sec_gap', 'axial_length',
-        'gg_inner_radius', 'r_exit_case', 'beta_init', 'x_swirl', 
-        'cone_angle', 'cone_len', 'ml_wh', 'ml_twist', 'ml_cross_section_curve'
-        ]
+INPUT_PARAMETERS_KEYS = [
+    'num_pipes', 'diam_1st_sec', 'imp_tan_rad', 'tot_area_ratio',
+    'len_star', 'del_len_star', 'radial_gap', 'cross_sec_gap', 'axial_length',
+    'gg_inner_radius', 'r_exit_case', 'beta_init', 'x_swirl',
+    'cone_angle', 'cone_len', 'ml_wh', 'ml_twist', 'ml_cross_section_curve'
+    ]
+
+INPUT_PARAMETERS_HEADER = r'input\s+parameters'
+
+# is_header as a bytes pattern for the byte-level scan: a non-blank line whose
+# first token is not a float literal (sign, digits with underscores, fraction,
+# exponent, inf, infinity, nan)
+FLOAT_TOKEN = (
+    rb'[+-]?(?:(?i:inf(?:inity)?|nan)'
+    rb'|(?:\d(?:_?\d)*(?:\.(?:\d(?:_?\d)*)?)?|\.\d(?:_?\d)*)(?:[eE][+-]?\d(?:_?\d)*)?)'
+)
+HEADER_RULE = rb'[ \t]*+(?!' + FLOAT_TOKEN + rb'(?:[\s\x1c-\x1f\x85\xa0]|$))(\S[^\r\n]*)'
 
-    index = foperate.find_string(string=r'input\s+parameters')
-    for i in range(1, 4):
-        input_parameter_values.append(foperate.get_line(index=index+i, split=True, sep=r'\s+'))
+# Lines are found from their leading newline, a literal prefix the regex engine
+# scans for quickly; the first line of a buffer is matched on its own
+HEADER_PATTERN = re.compile(rb'\n' + HEADER_RULE, re.MULTILINE)
+FIRST_HEADER_PATTERN = re.compile(HEADER_RULE, re.MULTILINE)
 
-    input_parameter_values = list(itertools.chain(*input_parameter_values))
 
+def is_header(line: str) -> bool:
+    tokens = line.split()
+    if not tokens:
+        return False
     try:
-        input_parameter_values = [float(val) for val in input_parameter_values]
-    except ValueError as ex:
-        return ex, False
+        float(tokens[0])
+    except ValueError:
+        return True
+    return False
 
-    out_dict = dict(zip(input_parameters_keys, input_parameter_values))
 
-    return out_dict, True
+def parse_input_parameters(lines: list) -> dict:
+    values = list(itertools.chain(*[re.split(r'\s+', line.strip()) for line in lines[:3]]))
+    values = [float(val) for val in values if val]
+    if len(values) < len(INPUT_PARAMETERS_KEYS):
+        raise ValueError(f'{len(INPUT_PARAMETERS_KEYS)} input parameters expected, {len(values)} found')
+    return dict(zip(INPUT_PARAMETERS_KEYS, values))
 
 
-def distribution(in_file: str, string: str) -> list:
+def parse_distribution(lines: list) -> list:
+    num_of_points = int(lines[0])
+    points = lines[1:num_of_points + 1]
+    if len(points) < num_of_points:
+        raise ValueError(f'{num_of_points} points expected, {len(points)} found')
+    return [[float(pi) for pi in re.split(r'\s|\t', point.strip())] for point in points]
+
+
+def split_sections(lines: list) -> dict:
+
+    sections = {}
+    header = None
+    for i, line in enumerate(lines):
+        if is_header(line):
+            header = line.lower().strip()
+            sections.setdefault(header, [i + 1, i + 1])
+        elif header is not None and line.strip():
+            sections[header][1] = i + 1
+
+    return {header: ((start, stop), lines[start:stop]) for header, (start, stop) in sections.items()}
+
+
+class P1112:
+
+    # Reads a p1112 file once, indexes its sections (header -> line range) and
+    # parses the input parameters and every distribution in the same pass
+
+    def __init__(self, in_file: str=None, text: str=None, sections: dict=None):
+        # sections: {header: ((start, stop), lines)} as produced by scan_p1112
+        self.__file = in_file
+        if sections is None:
+            if text is None:
+                with open(in_file, 'r') as fi:
+                    text = fi.read()
+            sections = split_sections(text.splitlines())
+
+        self.__index = {}
+        self.__input_parameters = None
+        self.__distributions = {}
+        self.__errors = {}
+
+        for header, (line_range, lines) in sections.items():
+            self.__index[header] = list(line_range)
+            try:
+                if re.fullmatch(INPUT_PARAMETERS_HEADER, header):
+                    self.__input_parameters = parse_input_parameters(lines)
+                else:
+                    self.__distributions[header] = parse_distribution(lines)
+            except (ValueError, IndexError) as ex:
+                self.__errors[header] = ex
+
+    @property
+    def file(self):
+        return self.__file
+
+    @property
+    def headers(self) -> list:
+        return list(self.__index.keys())
+
+    @property
+    def index(self) -> dict:
+        return {header: tuple(line_range) for header, line_range in self.__index.items()}
+
+    @property
+    def input_parameters(self) -> dict:
+        if self.__input_parameters is None:
+            raise ValueError(self.__errors.get(
+                self.find_header(string=INPUT_PARAMETERS_HEADER), 'Input parameters have not been found'
+            ))
+        return dict(self.__input_parameters)
+
+    @property
+    def distributions(self) -> dict:
+        return {header: [list(p) for p in points] for header, points in self.__distributions.items()}
+
+    def find_header(self, string: str) -> str or bool:
+        pattern = re.compile(string)
+        for header in self.__index:
+            if re.fullmatch(pattern, header):
+                return header
+        return False
+
+    def distribution(self, string: str) -> list:
+        header = self.find_header(string=string)
+        if not header:
+            raise ValueError(f'Section {string} has not been found')
+        if header in self.__errors:
+            raise ValueError(self.__errors[header])
+        return [list(p) for p in self.__distributions[header]]
 
-    foperate = Utils(in_file=in_file)
 
-    index = foperate.find_string(string=string)
+def read_p1112(in_file: str) -> P1112:
+    return P1112(in_file=in_file)
+
+
+def scan_p1112(buffer: bytes, in_file: str=None) -> Iterator[P1112]:
+
+    # Splits a buffer (bytes or mmap) into p1112 records at byte level. A new
+    # record starts whenever the first header of the current record repeats,
+    # so concatenated archives are read record by record; only the section
+    # bodies of the current record are decoded
+    record_header = None
+    sections = {}
+    line_no, pos = 0, 0
+    header, body_start, header_line = None, 0, 0
+
+    def section(end: int):
+        body = buffer[body_start:end].decode('latin-1').splitlines()
+        while body and not body[-1].strip():
+            body.pop()
+        return (header_line, header_line + len(body)), body
+
+    first = FIRST_HEADER_PATTERN.match(buffer)
+    for match in itertools.chain([first] if first else [], HEADER_PATTERN.finditer(buffer)):
+        name = match.group(1).decode('latin-1').lower().strip()
+        start = match.start() if match is first else match.start() + 1
+        line_no += buffer[pos:start].count(b'\n')
+        pos = start
+
+        if header is not None:
+            sections.setdefault(header, section(start))
+        if name == record_header:
+            yield P1112(in_file=in_file, sections=sections)
+            sections = {}
+            record_line = line_no
+        elif record_header is None:
+            record_header = name
+            record_line = line_no
+
+        header = name
+        header_line = line_no - record_line + 1
+        body_start = buffer.find(b'\n', match.end()) + 1 or len(buffer)
+
+    if header is not None:
+        sections.setdefault(header, section(len(buffer)))
+        yield P1112(in_file=in_file, sections=sections)
+
+
+def iter_p1112(path: str, ext: str='.p1112') -> Iterator[P1112]:
+
+    # Lazily yields P1112 records from a file, a concatenated archive or every
+    # *ext file of a directory; each file is memory-mapped, not read
+    if os.path.isdir(path):
+        files = sorted(
+            os.path.join(path, f) for f in os.listdir(path)
+            if f.lower().endswith(ext) and os.path.isfile(os.path.join(path, f))
+        )
+    else:
+        files = [path]
+
+    for in_file in files:
+        if not os.path.getsize(in_file):
+            continue
+        with open(in_file, 'rb') as fi:
+            with mmap.mmap(fi.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield from scan_p1112(buffer=buffer, in_file=in_file)
+
+
+def iter_distributions(path: str, string: str) -> Iterator[tuple]:
+
+    # Yields (file, points, True) or (file, error, False) for every record
+    for record in iter_p1112(path=path):
+        try:
+            yield record.file, record.distribution(string=string), True
+        except ValueError as ex:
+            yield record.file, ex, False
+
+
+def input_parameters_p1112(in_file: str) -> dict:
+
     try:
-        num_of_points = int(foperate.get_line(index=index+1))
+        out_dict = P1112(in_file=in_file).input_parameters
     except ValueError as ex:
         return ex, False
 
-    points = foperate.get_lines(start=index + 2, stop=index + num_of_points + 1, split=True, sep='\s|\t')
-    out = []
+    return out_dict, True
+
+
+def distribution(in_file: str, string: str) -> list:
+
     try:
-        for point in points:
-            out.append([float(pi) for pi in point])
+        out = P1112(in_file=in_file).distribution(string=string)
     except ValueError as ex:
         return ex, False
     return (out, True)
-    
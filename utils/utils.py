@@ -3,11 +3,12 @@ import os
 import re
 import glob
 
-from tkinter import filedialog as fd
-
 
 def select_file(**kwargs):
 
+    # tkinter is imported on demand so the parsers work on headless machines
+    from tkinter import filedialog as fd
+
     filetypes = kwargs.get('filetypes', None)
     initialdir = kwargs.get('initialdir', None)
     title = kwargs.get('title', None)